@@ -15,12 +15,62 @@ Usage:
     make qa-packaging
 """
 
+import hashlib
+import json
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import tomllib
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import NoReturn
+from typing import Any, NoReturn
+
+# Trailing output lines kept from build/install commands for failure reports
+PIP_TAIL_LINES = 200
+
+# Bundled pip at or above this version is used as-is in the template venv
+MIN_PIP_VERSION = (24, 0)
+
+# Scratch directory (relative to the repository root) for QA venvs
+QA_TMP_DIRNAME = ".qa-tmp"
+
+
+class QAError(Exception):
+    """Raised by a QA stage when one of its checks fails."""
+
+
+def log(line: str, logbuf: list[str] | None = None) -> None:
+    """Print a status line, or append it to ``logbuf`` when one is given.
+
+    Parameters
+    ----------
+    line : str
+        Line to log (without trailing newline).
+    logbuf : list[str] | None, optional
+        Buffer to collect lines in, by default None (print immediately).
+    """
+    if logbuf is None:
+        print(line)
+    else:
+        logbuf.append(line)
+
+
+def flush_log(logbuf: list[str]) -> None:
+    """Write buffered status lines to stdout with a single write and flush.
+
+    Parameters
+    ----------
+    logbuf : list[str]
+        Lines collected via ``log``/``run_command``; cleared afterwards.
+    """
+    if logbuf:
+        sys.stdout.write("\n".join(logbuf) + "\n")
+        logbuf.clear()
+    sys.stdout.flush()
 
 
 def run_command(
@@ -28,9 +78,17 @@ def run_command(
     cwd: Path | None = None,
     check: bool = True,
     capture_output: bool = False,
+    env: dict[str, str] | None = None,
+    tail_lines: int = 0,
+    logbuf: list[str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
     """Run a command and handle errors.
 
+    With ``tail_lines`` set, output is streamed through a bounded buffer
+    instead of being captured whole: only the last ``tail_lines`` lines are
+    kept, and they are printed only if the command fails. Memory use is
+    constant regardless of how much the command writes.
+
     Parameters
     ----------
     cmd : list[str]
@@ -41,22 +99,91 @@ def run_command(
         Raise exception on non-zero exit, by default True.
     capture_output : bool, optional
         Capture stdout/stderr, by default False.
+    env : dict[str, str] | None, optional
+        Environment for the command, by default None (inherit).
+    tail_lines : int, optional
+        Stream merged stdout/stderr, keeping only this many trailing lines
+        for failure reports, by default 0 (disabled).
+    logbuf : list[str] | None, optional
+        Collect status lines here instead of printing them, to be written
+        in one go with ``flush_log``, by default None (print immediately).
 
     Returns
     -------
     subprocess.CompletedProcess[str]
-        Result of command execution.
+        Result of command execution. With ``tail_lines``, ``stdout`` holds
+        the retained tail.
     """
-    print(f"→ Running: {' '.join(cmd)}")
+    log(f"→ Running: {' '.join(cmd)}", logbuf)
+    if tail_lines > 0:
+        return _run_streaming(
+            cmd, cwd=cwd, check=check, env=env, tail_lines=tail_lines, logbuf=logbuf
+        )
     return subprocess.run(
         cmd,
         cwd=cwd,
         check=check,
         text=True,
         capture_output=capture_output,
+        env=env,
     )
 
 
+def _run_streaming(
+    cmd: list[str],
+    cwd: Path | None,
+    check: bool,
+    env: dict[str, str] | None,
+    tail_lines: int,
+    logbuf: list[str] | None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command, draining its output into a bounded tail buffer."""
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            tail.append(line)
+        returncode = process.wait()
+
+    output = "".join(tail)
+    if returncode != 0:
+        log(f"--- last {len(tail)} lines of output ---\n{output.rstrip()}", logbuf)
+        if check:
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+    return subprocess.CompletedProcess(cmd, returncode, stdout=output)
+
+
+def qa_tmp_dir(repo_root: Path) -> Path:
+    """Return the scratch directory for QA venvs, creating it if needed.
+
+    Venvs live under ``.qa-tmp/`` in the repository rather than the system
+    temp dir, keeping them on the same filesystem as ``dist/`` and the
+    template venv so that clones can use hardlinks and installs avoid
+    cross-volume copies (notably on Windows runners).
+
+    Parameters
+    ----------
+    repo_root : Path
+        Root directory of the repository.
+
+    Returns
+    -------
+    Path
+        Path to ``.qa-tmp/``.
+    """
+    tmp_dir = repo_root / QA_TMP_DIRNAME
+    tmp_dir.mkdir(exist_ok=True)
+    return tmp_dir
+
+
 def fail(message: str) -> NoReturn:
     """Print error message and exit with code 1.
 
@@ -69,6 +196,55 @@ def fail(message: str) -> NoReturn:
     sys.exit(1)
 
 
+def run_stage(stage: Callable[..., None], *args: Any) -> dict[str, str | None]:
+    """Run a QA stage with its output captured into a log.
+
+    Intended to run inside a worker process: stdout/stderr file descriptors
+    are redirected so that subprocess output is captured as well, keeping
+    the logs of concurrently running stages from interleaving.
+
+    Parameters
+    ----------
+    stage : Callable[..., None]
+        Stage function to run.
+    *args : Any
+        Positional arguments forwarded to the stage.
+
+    Returns
+    -------
+    dict[str, str | None]
+        Result with keys ``stage`` (function name), ``log`` (captured output)
+        and ``error`` (failure message, or None if the stage passed).
+    """
+    error: str | None = None
+
+    with tempfile.TemporaryFile() as log_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = (os.dup(1), os.dup(2))
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(log_file.fileno(), 2)
+        try:
+            stage(*args)
+        except QAError as e:
+            error = str(e)
+        except subprocess.CalledProcessError as e:
+            error = f"Command failed with exit code {e.returncode}: {' '.join(e.cmd)}"
+        except Exception as e:
+            error = f"Unexpected error: {e}"
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for target, saved in zip((1, 2), saved_fds, strict=True):
+                os.dup2(saved, target)
+                os.close(saved)
+
+        log_file.seek(0)
+        output = log_file.read().decode("utf-8", errors="replace")
+
+    return {"stage": stage.__name__, "log": output, "error": error}
+
+
 def section(title: str) -> None:
     """Print section header.
 
@@ -82,6 +258,68 @@ def section(title: str) -> None:
     print(f"{'=' * 70}\n")
 
 
+# Inputs of the built artifacts, hashed to key the artifact cache
+SOURCE_PATHS = ("pyproject.toml", "README.md", "LICENSE", "schemas", "src")
+
+
+def _source_hash(repo_root: Path) -> str:
+    """Compute a SHA-256 over every file that goes into the artifacts.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Root directory of the repository.
+
+    Returns
+    -------
+    str
+        Hex digest over the relative paths and contents of ``SOURCE_PATHS``.
+    """
+    digest = hashlib.sha256()
+    for name in SOURCE_PATHS:
+        top = repo_root / name
+        files = [top] if top.is_file() else sorted(top.rglob("*"))
+        for path in files:
+            if not path.is_file() or "__pycache__" in path.parts:
+                continue
+            digest.update(path.relative_to(repo_root).as_posix().encode("utf-8") + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def ensure_build_backend(repo_root: Path) -> None:
+    """Install the build backend into the running interpreter, once.
+
+    Building with ``--no-isolation`` skips the throwaway build environment
+    that ``python -m build`` otherwise bootstraps on every run. The backend
+    (``[build-system].requires``) and ``build`` are installed into the
+    current environment, and a stamp under ``.qa-build-cache/`` keyed on
+    the hash of ``pyproject.toml`` skips the install on later runs.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Root directory of the repository.
+    """
+    pyproject = repo_root / "pyproject.toml"
+    pyproject_bytes = pyproject.read_bytes()
+    digest = hashlib.sha256(pyproject_bytes).hexdigest()
+
+    stamp = repo_root / ".qa-build-cache" / "stamp"
+    if stamp.exists() and stamp.read_text().strip() == f"{sys.executable} {digest}":
+        print("✓ Build backend already installed (pyproject.toml unchanged)")
+        return
+
+    requires = tomllib.loads(pyproject_bytes.decode("utf-8"))["build-system"]["requires"]
+    run_command(
+        [sys.executable, "-m", "pip", "install", "--upgrade", "build", *requires],
+        tail_lines=PIP_TAIL_LINES,
+    )
+
+    stamp.parent.mkdir(exist_ok=True)
+    stamp.write_text(f"{sys.executable} {digest}\n")
+
+
 def check_build_artifacts(repo_root: Path) -> tuple[Path, Path]:
     """Build and validate wheel + sdist artifacts.
 
@@ -106,21 +344,60 @@ def check_build_artifacts(repo_root: Path) -> tuple[Path, Path]:
             print(f"Cleaning {directory}")
             shutil.rmtree(directory)
 
-    # Build wheel and sdist
-    run_command([sys.executable, "-m", "build", "--sdist", "--wheel"], cwd=repo_root)
+    # Reuse artifacts built from an identical source tree
+    cache_root = repo_root / ".qa-cache"
+    cache_entry = cache_root / _source_hash(repo_root)
+    cache_dir = cache_entry / "dist"
+    cached_wheels = list(cache_dir.glob("*.whl"))
+    cached_sdists = list(cache_dir.glob("*.tar.gz"))
+    if cached_wheels and cached_sdists:
+        print(f"✓ Source unchanged, reusing artifacts from {cache_dir}")
+        dist_dir.mkdir()
+        for artifact in cached_wheels + cached_sdists:
+            shutil.copy2(artifact, dist_dir / artifact.name)
+    else:
+        # Build wheel and sdist concurrently against the pre-installed backend;
+        # threads suffice since the work happens in the subprocesses
+        ensure_build_backend(repo_root)
+        logbuf: list[str] = []
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        run_command,
+                        [sys.executable, "-m", "build", artifact, "--no-isolation"],
+                        cwd=repo_root,
+                        tail_lines=PIP_TAIL_LINES,
+                        logbuf=logbuf,
+                    )
+                    for artifact in ("--sdist", "--wheel")
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            flush_log(logbuf)
+
+        if dist_dir.exists():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            shutil.copytree(dist_dir, cache_dir)
+            # Only the current source tree can be reused; drop older builds
+            # so the cache does not grow with every edit.
+            for stale in cache_root.iterdir():
+                if stale != cache_entry:
+                    shutil.rmtree(stale, ignore_errors=True)
 
     # Validate artifacts exist
     if not dist_dir.exists():
-        fail("dist/ directory not created")
+        raise QAError("dist/ directory not created")
 
     wheels = list(dist_dir.glob("*.whl"))
     sdists = list(dist_dir.glob("*.tar.gz"))
 
     if not wheels:
-        fail("No wheel (.whl) file found in dist/")
+        raise QAError("No wheel (.whl) file found in dist/")
 
     if not sdists:
-        fail("No sdist (.tar.gz) file found in dist/")
+        raise QAError("No sdist (.tar.gz) file found in dist/")
 
     wheel_path = wheels[0]
     sdist_path = sdists[0]
@@ -167,222 +444,325 @@ def check_metadata_and_readme(repo_root: Path) -> None:
             print("See: https://github.com/python-poetry/poetry-core/issues/567")
             print("\n✓ Metadata check passed (ignoring known poetry-core issue)")
         else:
-            fail("twine check --strict reported warnings or errors")
+            raise QAError("twine check --strict reported warnings or errors")
     else:
         print("✓ All metadata and README checks passed (0 warnings, 0 errors)")
 
 
-def test_install_wheel(repo_root: Path, wheel_path: Path) -> None:
-    """Test installation from wheel in clean venv.
+def pip_install(python_exe: Path, target: Path, repo_root: Path) -> None:
+    """Install a wheel or sdist (with dependencies) into a venv.
+
+    Uses ``uv pip install`` when ``uv`` is on PATH. Otherwise falls back to
+    pip with a persistent download cache under ``.pip-cache/`` so repeated
+    QA runs do not re-download dependencies.
 
     Parameters
     ----------
+    python_exe : Path
+        Python executable of the target venv.
+    target : Path
+        Wheel or sdist to install.
     repo_root : Path
         Root directory of the repository.
-    wheel_path : Path
-        Path to wheel file.
     """
-    section("C) Install Test (wheel)")
+    uv = shutil.which("uv")
+    if uv:
+        run_command(
+            [uv, "pip", "install", "--python", str(python_exe), str(target)],
+            tail_lines=PIP_TAIL_LINES,
+        )
+        return
 
-    with tempfile.TemporaryDirectory(prefix="venv_pkg_wheel_") as tmpdir:
-        venv_path = Path(tmpdir)
-        print(f"Creating clean venv at {venv_path}")
+    env = {**os.environ, "PIP_CACHE_DIR": str(repo_root / ".pip-cache")}
+    run_command(
+        [str(python_exe), "-m", "pip", "install", "--no-compile", str(target)],
+        env=env,
+        tail_lines=PIP_TAIL_LINES,
+    )
 
-        # Create venv
-        run_command([sys.executable, "-m", "venv", str(venv_path)])
 
-        # Determine python executable in venv
-        if sys.platform == "win32":
-            python_exe = venv_path / "Scripts" / "python.exe"
-            pip_exe = venv_path / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_path / "bin" / "python"
-            pip_exe = venv_path / "bin" / "pip"
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Parse the leading numeric release segment of a version string.
 
-        # Upgrade pip
-        run_command([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"])
+    Parameters
+    ----------
+    version : str
+        Version string such as ``"24.0"`` or ``"25.1.dev0"``.
 
-        # Install from wheel with dependencies for CLI functionality
-        run_command([str(pip_exe), "install", str(wheel_path)])
+    Returns
+    -------
+    tuple[int, ...]
+        Numeric components, stopping at the first non-numeric one.
+    """
+    parts: list[int] = []
+    for part in version.split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
 
-        # Smoke test: import
-        result = run_command(
-            [str(python_exe), "-c", "import srdedupe; print('import-ok')"],
-            capture_output=True,
-        )
-        if "import-ok" not in result.stdout:
-            fail("Failed to import srdedupe")
-        print("✓ Import test passed")
-
-        # Smoke test: version
-        result = run_command(
-            [
-                str(python_exe),
-                "-c",
-                "import importlib.metadata as m; print(m.version('srdedupe'))",
-            ],
-            capture_output=True,
-        )
-        version = result.stdout.strip()
-        print(f"✓ Version check passed: {version}")
-
-        # Smoke test: CLI --help
-        srdedupe_exe = (
-            venv_path / "Scripts" / "srdedupe.exe"
-            if sys.platform == "win32"
-            else venv_path / "bin" / "srdedupe"
+
+def build_template_venv(parent_dir: Path) -> Path:
+    """Create the template venv shared by the install stages.
+
+    The venv is created (and pip upgraded, if older than
+    ``MIN_PIP_VERSION``) once; the install stages then clone it with
+    ``clone_venv`` instead of repeating both steps.
+
+    Parameters
+    ----------
+    parent_dir : Path
+        Directory in which ``template_venv/`` is created.
+
+    Returns
+    -------
+    Path
+        Path to the template venv.
+    """
+    section("Template venv")
+
+    template = parent_dir / "template_venv"
+    print(f"Creating template venv at {template}")
+    run_command([sys.executable, "-m", "venv", str(template)])
+
+    python_exe, _ = _venv_executables(template)
+
+    # Only upgrade pip when the bundled one is older than MIN_PIP_VERSION
+    result = run_command([str(python_exe), "-m", "pip", "--version"], capture_output=True)
+    pip_version = _parse_version(result.stdout.split()[1])
+    if pip_version >= MIN_PIP_VERSION:
+        print(f"✓ Bundled pip {result.stdout.split()[1]} is recent enough, skipping upgrade")
+    else:
+        run_command(
+            [str(python_exe), "-m", "pip", "install", "--upgrade", "pip"],
+            tail_lines=PIP_TAIL_LINES,
         )
-        run_command([str(srdedupe_exe), "--help"], capture_output=True)
-        print("✓ CLI --help passed")
 
-        # Smoke test: CLI --version
-        result = run_command([str(srdedupe_exe), "--version"], capture_output=True)
-        print(f"✓ CLI --version passed: {result.stdout.strip()}")
+    return template
 
-        print("\n✓ All wheel install tests passed")
 
+def _link_or_copy(src: str, dst: str) -> object:
+    """Hardlink ``src`` to ``dst``, copying when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+    return dst
 
-def test_install_sdist(repo_root: Path, sdist_path: Path) -> None:
-    """Test installation from sdist in clean venv.
+
+def clone_venv(template: Path, venv_path: Path) -> None:
+    """Clone the template venv to ``venv_path``.
+
+    Files are hardlinked where the platform and filesystem allow it, so the
+    clone costs almost no disk I/O. On Windows a plain copy is made. Pip must
+    be invoked as ``python -m pip`` in the clone, since the ``pip`` script
+    shebang still points at the template.
 
     Parameters
     ----------
-    repo_root : Path
-        Root directory of the repository.
-    sdist_path : Path
-        Path to sdist file.
+    template : Path
+        Template venv created by ``build_template_venv``.
+    venv_path : Path
+        Destination path (must not exist).
     """
-    section("D) Install Test (sdist)")
+    copy_function = shutil.copy2 if sys.platform == "win32" else _link_or_copy
+    shutil.copytree(template, venv_path, symlinks=True, copy_function=copy_function)
 
-    with tempfile.TemporaryDirectory(prefix="venv_pkg_sdist_") as tmpdir:
-        venv_path = Path(tmpdir)
-        print(f"Creating clean venv at {venv_path}")
 
-        # Create venv
-        run_command([sys.executable, "-m", "venv", str(venv_path)])
+def _venv_executables(venv_path: Path) -> tuple[Path, Path]:
+    """Return the ``python`` and ``srdedupe`` executables of a venv.
 
-        # Determine python executable in venv
-        if sys.platform == "win32":
-            python_exe = venv_path / "Scripts" / "python.exe"
-            pip_exe = venv_path / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_path / "bin" / "python"
-            pip_exe = venv_path / "bin" / "pip"
+    Parameters
+    ----------
+    venv_path : Path
+        Root of the venv.
 
-        # Upgrade pip
-        run_command([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"])
+    Returns
+    -------
+    tuple[Path, Path]
+        Paths to the venv's python and srdedupe console script.
+    """
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe", venv_path / "Scripts" / "srdedupe.exe"
+    return venv_path / "bin" / "python", venv_path / "bin" / "srdedupe"
 
-        # Install from sdist with dependencies for CLI functionality
-        # pip will build wheel from sdist during install
-        run_command([str(pip_exe), "install", str(sdist_path)])
 
-        # Smoke test: import
-        result = run_command(
-            [str(python_exe), "-c", "import srdedupe; print('import-ok')"],
-            capture_output=True,
-        )
-        if "import-ok" not in result.stdout:
-            fail("Failed to import srdedupe from sdist")
-        print("✓ Import test passed")
-
-        # Smoke test: version
-        result = run_command(
-            [
-                str(python_exe),
-                "-c",
-                "import importlib.metadata as m; print(m.version('srdedupe'))",
-            ],
-            capture_output=True,
-        )
-        version = result.stdout.strip()
-        print(f"✓ Version check passed: {version}")
-
-        # Smoke test: CLI --help
-        srdedupe_exe = (
-            venv_path / "Scripts" / "srdedupe.exe"
-            if sys.platform == "win32"
-            else venv_path / "bin" / "srdedupe"
-        )
-        run_command([str(srdedupe_exe), "--help"], capture_output=True)
-        print("✓ CLI --help passed")
+def _make_venv(venv_path: Path, template_venv: Path) -> tuple[Path, Path]:
+    """Create a stage venv by cloning the template venv.
 
-        # Smoke test: CLI --version
-        result = run_command([str(srdedupe_exe), "--version"], capture_output=True)
-        print(f"✓ CLI --version passed: {result.stdout.strip()}")
+    Parameters
+    ----------
+    venv_path : Path
+        Destination path (must not exist).
+    template_venv : Path
+        Template venv created by ``build_template_venv``.
 
-        print("\n✓ All sdist install tests passed")
+    Returns
+    -------
+    tuple[Path, Path]
+        Paths to the venv's python and srdedupe console script.
+    """
+    print(f"Cloning template venv into {venv_path}")
+    clone_venv(template_venv, venv_path)
+    return _venv_executables(venv_path)
+
+
+# Import, version and ``--help`` checks, run in one interpreter in the venv
+SMOKE_TEST_SCRIPT = """
+import importlib.metadata
+import json
+
+import srdedupe
+from click.testing import CliRunner
+from srdedupe.cli.main import cli
+
+help_result = CliRunner().invoke(cli, ["--help"])
+print(json.dumps({
+    "import": srdedupe.__name__,
+    "version": importlib.metadata.version("srdedupe"),
+    "help_exit_code": help_result.exit_code,
+}))
+"""
 
 
-def test_cli_functional(repo_root: Path) -> None:
-    """Run CLI functional smoke test with real fixture.
+def run_smoke_tests(python_exe: Path, srdedupe_exe: Path) -> None:
+    """Run the install smoke tests against a venv.
+
+    Import, version and CLI ``--help`` are checked in a single interpreter
+    via ``SMOKE_TEST_SCRIPT``; the console script itself is then exercised
+    once with ``--version``.
+
+    Parameters
+    ----------
+    python_exe : Path
+        Python executable of the venv.
+    srdedupe_exe : Path
+        ``srdedupe`` console script of the venv.
+    """
+    result = run_command([str(python_exe), "-c", SMOKE_TEST_SCRIPT], capture_output=True)
+    try:
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError) as e:
+        raise QAError(f"Could not read smoke test report: {result.stdout!r}") from e
+
+    if report["import"] != "srdedupe":
+        raise QAError("Failed to import srdedupe")
+    print("✓ Import test passed")
+    print(f"✓ Version check passed: {report['version']}")
+
+    if report["help_exit_code"] != 0:
+        raise QAError(f"CLI --help exited with code {report['help_exit_code']}")
+    print("✓ CLI --help passed")
+
+    result = run_command([str(srdedupe_exe), "--version"], capture_output=True)
+    print(f"✓ CLI --version passed: {result.stdout.strip()}")
+
+
+def test_install_wheel(repo_root: Path, wheel_path: Path, template_venv: Path) -> None:
+    """Test installation from wheel in clean venv.
+
+    The CLI functional test (stage E) runs in the same venv afterwards.
 
     Parameters
     ----------
     repo_root : Path
         Root directory of the repository.
+    wheel_path : Path
+        Path to wheel file.
+    template_venv : Path
+        Template venv to clone (see ``build_template_venv``).
     """
-    section("E) CLI Functional Smoke Test")
+    section("C) Install Test (wheel)")
 
-    with tempfile.TemporaryDirectory(prefix="venv_cli_test_") as tmpdir:
-        venv_path = Path(tmpdir)
-        print(f"Creating clean venv at {venv_path}")
+    with tempfile.TemporaryDirectory(prefix="venv_pkg_wheel_", dir=qa_tmp_dir(repo_root)) as tmpdir:
+        python_exe, srdedupe_exe = _make_venv(Path(tmpdir) / "venv", template_venv)
 
-        # Create venv
-        run_command([sys.executable, "-m", "venv", str(venv_path)])
+        # Install from wheel with dependencies for CLI functionality
+        pip_install(python_exe, wheel_path, repo_root)
 
-        # Determine python executable in venv
-        if sys.platform == "win32":
-            python_exe = venv_path / "Scripts" / "python.exe"
-            pip_exe = venv_path / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_path / "bin" / "python"
-            pip_exe = venv_path / "bin" / "pip"
+        run_smoke_tests(python_exe, srdedupe_exe)
 
-        # Upgrade pip
-        run_command([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"])
+        print("\n✓ All wheel install tests passed")
 
-        # Install package with dependencies
-        wheel_path = list((repo_root / "dist").glob("*.whl"))[0]
-        run_command([str(pip_exe), "install", str(wheel_path)])
+        # E) reuses this venv instead of installing the wheel again
+        test_cli_functional(repo_root, srdedupe_exe, Path(tmpdir))
 
-        # Create output directory
-        output_dir = Path(tmpdir) / "output"
-        output_dir.mkdir()
 
-        # Run functional test: parse command with real fixture
-        fixture_path = repo_root / "tests" / "fixtures" / "real" / "mini_generic.ris"
-        output_path = output_dir / "parsed_output.jsonl"
+def test_install_sdist(repo_root: Path, sdist_path: Path, template_venv: Path) -> None:
+    """Test installation from sdist in clean venv.
 
-        srdedupe_exe = (
-            venv_path / "Scripts" / "srdedupe.exe"
-            if sys.platform == "win32"
-            else venv_path / "bin" / "srdedupe"
-        )
+    Parameters
+    ----------
+    repo_root : Path
+        Root directory of the repository.
+    sdist_path : Path
+        Path to sdist file.
+    template_venv : Path
+        Template venv to clone (see ``build_template_venv``).
+    """
+    section("D) Install Test (sdist)")
 
-        run_command(
-            [
-                str(srdedupe_exe),
-                "parse",
-                str(fixture_path),
-                "--output",
-                str(output_path),
-            ]
-        )
+    with tempfile.TemporaryDirectory(prefix="venv_pkg_sdist_", dir=qa_tmp_dir(repo_root)) as tmpdir:
+        python_exe, srdedupe_exe = _make_venv(Path(tmpdir) / "venv", template_venv)
+
+        # Install from sdist with dependencies for CLI functionality
+        # pip will build wheel from sdist during install
+        pip_install(python_exe, sdist_path, repo_root)
 
-        # Verify output file was created
-        if not output_path.exists():
-            fail(f"Expected output file not created: {output_path}")
+        run_smoke_tests(python_exe, srdedupe_exe)
 
-        # Verify output has content
-        content = output_path.read_text()
-        if not content.strip():
-            fail("Output file is empty")
+        print("\n✓ All sdist install tests passed")
 
-        print("✓ CLI parse command succeeded")
-        print(f"✓ Output file created: {output_path.name}")
-        print(f"✓ Output has {len(content.splitlines())} lines")
 
-        print("\n✓ All CLI functional tests passed")
+def test_cli_functional(repo_root: Path, srdedupe_exe: Path, work_dir: Path) -> None:
+    """Run CLI functional smoke test with real fixture.
+
+    Runs against the venv of the wheel install stage rather than a venv of
+    its own.
+
+    Parameters
+    ----------
+    repo_root : Path
+        Root directory of the repository.
+    srdedupe_exe : Path
+        ``srdedupe`` console script of a venv with the wheel installed.
+    work_dir : Path
+        Scratch directory for the command's output.
+    """
+    section("E) CLI Functional Smoke Test")
+
+    # Create output directory
+    output_dir = work_dir / "output"
+    output_dir.mkdir()
+
+    # Run functional test: parse command with real fixture
+    fixture_path = repo_root / "tests" / "fixtures" / "real" / "mini_generic.ris"
+    output_path = output_dir / "parsed_output.jsonl"
+
+    run_command(
+        [
+            str(srdedupe_exe),
+            "parse",
+            str(fixture_path),
+            "--output",
+            str(output_path),
+        ]
+    )
+
+    # Verify output file was created
+    if not output_path.exists():
+        raise QAError(f"Expected output file not created: {output_path}")
+
+    # Verify output has content
+    content = output_path.read_text()
+    if not content.strip():
+        raise QAError("Output file is empty")
+
+    print("✓ CLI parse command succeeded")
+    print(f"✓ Output file created: {output_path.name}")
+    print(f"✓ Output has {len(content.splitlines())} lines")
+
+    print("\n✓ All CLI functional tests passed")
 
 
 def main() -> None:
@@ -401,14 +781,27 @@ def main() -> None:
         # B) Metadata and README
         check_metadata_and_readme(repo_root)
 
-        # C) Install from wheel
-        test_install_wheel(repo_root, wheel_path)
+        tmp_root = qa_tmp_dir(repo_root)
+        with tempfile.TemporaryDirectory(prefix="venv_template_", dir=tmp_root) as template_dir:
+            template_venv = build_template_venv(Path(template_dir))
 
-        # D) Install from sdist
-        test_install_sdist(repo_root, sdist_path)
-
-        # E) CLI functional test
-        test_cli_functional(repo_root)
+            # C (+E, which shares C's venv) and D are independent: run them
+            # concurrently and print each stage's captured log once finished.
+            stages: list[tuple[Callable[..., None], tuple[Any, ...]]] = [
+                (test_install_wheel, (repo_root, wheel_path, template_venv)),
+                (test_install_sdist, (repo_root, sdist_path, template_venv)),
+            ]
+            max_workers = min(len(stages), max(1, (os.cpu_count() or 1) - 2))
+            sys.stdout.flush()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(run_stage, stage, *args) for stage, args in stages]
+                results = [future.result() for future in futures]
+
+        sys.stdout.write("".join(str(result["log"]) for result in results))
+        sys.stdout.flush()
+        errors = [f"{r['stage']}: {r['error']}" for r in results if r["error"]]
+        if errors:
+            raise QAError("; ".join(errors))
 
         # Success
         print("\n" + "=" * 70)
@@ -416,6 +809,8 @@ def main() -> None:
         print("=" * 70)
         sys.exit(0)
 
+    except QAError as e:
+        fail(str(e))
     except subprocess.CalledProcessError as e:
         fail(f"Command failed with exit code {e.returncode}: {' '.join(e.cmd)}")
     except KeyboardInterrupt:
@@ -19,16 +19,55 @@ __version__ = "0.18.0"
 __author__ = "Ennio Politi Lopes <enniolopes@gmail.com>"
 __license__ = "MIT"
 
-from srdedupe.api import (
-    ParseError,
-    dedupe,
-    parse_file,
-    parse_folder,
-    write_jsonl,
-)
-from srdedupe.models import CanonicalRecord
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from srdedupe.api import (
+        ParseError,
+        dedupe,
+        parse_file,
+        parse_folder,
+        parse_folder_iter,
+        write_jsonl,
+    )
+    from srdedupe.models import CanonicalRecord
+
+# ``normalize`` names both a subpackage and the function exported here.
+# Importing any ``srdedupe.normalize.*`` module binds the subpackage onto
+# this package, which would shadow a lazily resolved function, so it is
+# imported eagerly.
 from srdedupe.normalize import normalize
 
+# The remaining public names are imported on first access (PEP 562), so
+# that ``import srdedupe`` (e.g. for ``__version__``) stays cheap.
+_LAZY_IMPORTS = {
+    "CanonicalRecord": "srdedupe.models",
+    "parse_file": "srdedupe.api",
+    "parse_folder": "srdedupe.api",
+    "parse_folder_iter": "srdedupe.api",
+    "dedupe": "srdedupe.api",
+    "write_jsonl": "srdedupe.api",
+    "ParseError": "srdedupe.api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API names lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted({name for name in globals() if name.startswith("__")} | set(__all__))
+
+
 __all__ = [
     "__version__",
     "__author__",
@@ -36,6 +75,7 @@ __all__ = [
     "CanonicalRecord",
     "parse_file",
     "parse_folder",
+    "parse_folder_iter",
     "dedupe",
     "write_jsonl",
     "normalize",
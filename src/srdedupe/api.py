@@ -9,18 +9,28 @@ This module provides the main public API for srdedupe, enabling:
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from srdedupe.models import CanonicalRecord
-from srdedupe.parse.ingestion import ingest_file, ingest_folder
+from srdedupe.parse.ingestion import ingest_file, ingest_folder, ingest_folder_iter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from srdedupe.engine.config import PipelineResult
 
+# Write buffer for JSONL output: few large writes instead of one per record
+_WRITE_BUFFER_SIZE = 1 << 20
+
 __all__ = [
     "parse_file",
     "parse_folder",
+    "parse_folder_iter",
     "write_jsonl",
     "dedupe",
     "ParseError",
@@ -109,6 +119,7 @@ def parse_folder(
     pattern: str | None = None,
     recursive: bool = False,
     strict: bool = False,
+    workers: int | None = None,
 ) -> list[CanonicalRecord]:
     """Parse all supported files in a folder.
 
@@ -127,6 +138,10 @@ def parse_folder(
     strict : bool, optional
         If True, raise exception on any parse errors. If False, log warnings
         and continue, by default False.
+    workers : int | None, optional
+        Number of processes used to parse files in parallel. Worthwhile for
+        folders with many files; None (default) parses serially. Record
+        order is the same either way.
 
     Returns
     -------
@@ -151,6 +166,10 @@ def parse_folder(
     Parse recursively with filtering:
 
         >>> records = parse_folder("data/", pattern="*.ris", recursive=True)
+
+    Parse a large folder using 4 processes:
+
+        >>> records = parse_folder("data/", workers=4)
     """
     folder_path = Path(path)
 
@@ -162,7 +181,9 @@ def parse_folder(
 
     glob_pattern = pattern if pattern else "*"
 
-    records, report = ingest_folder(folder_path, recursive=recursive, glob_pattern=glob_pattern)
+    records, report = ingest_folder(
+        folder_path, recursive=recursive, glob_pattern=glob_pattern, workers=workers
+    )
 
     if report.total_errors > 0 and strict:
         error_files = [
@@ -175,26 +196,116 @@ def parse_folder(
     return records
 
 
+def parse_folder_iter(
+    path: str | Path,
+    *,
+    pattern: str | None = None,
+    recursive: bool = False,
+    strict: bool = False,
+) -> Iterator[CanonicalRecord]:
+    """Lazily parse all supported files in a folder.
+
+    Streaming counterpart of :func:`parse_folder`: records are yielded file
+    by file instead of being collected into a list, so peak memory is
+    bounded by the largest single file. Combined with :func:`write_jsonl`,
+    which accepts any iterable, a folder can be converted to JSONL without
+    ever holding all records in memory. The trade-off is that records can
+    only be consumed once and, in strict mode, records from files preceding
+    a failing one have already been yielded when the error is raised.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to folder containing files.
+    pattern : str | None, optional
+        Glob pattern to filter files (e.g., '*.ris').
+        If None, all supported extensions are included.
+    recursive : bool, optional
+        Whether to search recursively in subdirectories, by default False.
+    strict : bool, optional
+        If True, raise on the first file with parse errors. If False,
+        skip errors and continue, by default False.
+
+    Returns
+    -------
+    Iterator[CanonicalRecord]
+        Parsed canonical records from all files, in file order.
+
+    Raises
+    ------
+    ParseError
+        During iteration, if a file fails to parse and strict=True.
+    FileNotFoundError
+        If folder does not exist.
+
+    Examples
+    --------
+    Convert a large folder to JSONL with bounded memory:
+
+        >>> from srdedupe import parse_folder_iter, write_jsonl
+        >>> write_jsonl(parse_folder_iter("data/", recursive=True), "output.jsonl")
+    """
+    folder_path = Path(path)
+
+    if not folder_path.exists():
+        raise FileNotFoundError(f"Folder not found: {path}")
+
+    if not folder_path.is_dir():
+        raise ValueError(f"Path is not a directory: {path}")
+
+    glob_pattern = pattern if pattern else "*"
+
+    return _iter_folder_records(folder_path, recursive, glob_pattern, strict)
+
+
+def _iter_folder_records(
+    folder_path: Path,
+    recursive: bool,
+    glob_pattern: str,
+    strict: bool,
+) -> Iterator[CanonicalRecord]:
+    """Yield records file by file (generator behind ``parse_folder_iter``)."""
+    for records, result in ingest_folder_iter(folder_path, recursive, glob_pattern):
+        if result.errors and strict:
+            raise ParseError(
+                f"Failed to parse {result.filename}: {'; '.join(result.errors)}",
+                file=result.filepath,
+            )
+        yield from records
+
+
 def write_jsonl(
-    records: list[CanonicalRecord],
+    records: Iterable[CanonicalRecord],
     path: str | Path,
     *,
     sort_keys: bool = True,
-) -> None:
+) -> int:
     """Write records to JSONL file (one JSON object per line).
 
-    Output is deterministic with consistent field ordering and UTF-8 encoding.
+    Output is deterministic with consistent field ordering, compact
+    separators and UTF-8 encoding. Records are serialized with ``orjson``
+    when it is installed (``pip install srdedupe[fast]``), falling back to
+    the stdlib ``json`` module. Both decode to the same values, but float
+    spelling can differ (``0.00001`` vs ``1e-05``), and non-finite floats
+    become ``null`` with ``orjson`` while the fallback raises ``ValueError``.
 
     Parameters
     ----------
-    records : list[CanonicalRecord]
-        Records to write.
+    records : Iterable[CanonicalRecord]
+        Records to write. Any iterable is accepted, including the lazy
+        iterator returned by :func:`parse_folder_iter`.
     path : str | Path
         Output file path.
     sort_keys : bool, optional
         Whether to sort dictionary keys for deterministic output,
         by default True.
 
+    Returns
+    -------
+    int
+        Number of records written, so a lazy iterator can be streamed
+        without being counted separately.
+
     Examples
     --------
     Export parsed records to JSONL:
@@ -204,15 +315,29 @@ def write_jsonl(
         >>> write_jsonl(records, "output.jsonl")
     """
     file_path = Path(path)
+    count = 0
+
+    with file_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+            for record in records:
+                f.write(orjson.dumps(record.to_dict(), option=option))
+                count += 1
+            return count
 
-    with file_path.open("w", encoding="utf-8", newline="\n") as f:
         for record in records:
             json_str = json.dumps(
                 record.to_dict(),
                 ensure_ascii=False,
                 sort_keys=sort_keys,
+                allow_nan=False,
+                separators=(",", ":"),
             )
-            f.write(json_str + "\n")
+            f.write(json_str.encode("utf-8"))
+            f.write(b"\n")
+            count += 1
+
+    return count
 
 
 def dedupe(
@@ -1,7 +1,7 @@
 """Run context manager for audit logging and manifest tracking."""
 
 import sys
-import traceback
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -26,6 +26,8 @@ from srdedupe.utils import get_iso_timestamp
 
 __all__ = ["RunContext"]
 
+DEFAULT_MAX_RECORD_TRACEBACKS = 10
+
 
 class RunContext:
     """Context manager for pipeline run lifecycle.
@@ -46,6 +48,9 @@ class RunContext:
         Manifest builder and writer.
     start_time : datetime
         Run start timestamp.
+    max_record_tracebacks : int
+        Maximum number of record-level errors (those with a ``rid``) that
+        get a formatted traceback; later ones are recorded without one.
     """
 
     def __init__(
@@ -54,6 +59,7 @@ class RunContext:
         output_dir: Path,
         audit_logger: AuditLogger,
         manifest_writer: ManifestWriter,
+        max_record_tracebacks: int = DEFAULT_MAX_RECORD_TRACEBACKS,
     ) -> None:
         """Initialize run context.
 
@@ -67,13 +73,20 @@ class RunContext:
             Event logger.
         manifest_writer : ManifestWriter
             Manifest writer.
+        max_record_tracebacks : int, optional
+            Traceback budget for record-level errors, by default 10.
         """
         self.run_id = run_id
         self.output_dir = output_dir
         self.audit_logger = audit_logger
         self.manifest_writer = manifest_writer
         self.start_time = datetime.now(UTC)
-        self._stage_start_times: dict[str, datetime] = {}
+        # Monotonic nanosecond clocks for durations; start_time stays for
+        # wall-clock use. Converted to seconds only when reported.
+        self._run_start_ns = time.perf_counter_ns()
+        self._stage_start_ns: dict[str, int] = {}
+        self.max_record_tracebacks = max_record_tracebacks
+        self._record_tracebacks = 0
 
     @classmethod
     def start(
@@ -81,6 +94,7 @@ class RunContext:
         output_dir: Path,
         parameters: dict[str, Any],
         command_argv: list[str] | None = None,
+        max_record_tracebacks: int = DEFAULT_MAX_RECORD_TRACEBACKS,
     ) -> "RunContext":
         """Start a new run context.
 
@@ -94,6 +108,8 @@ class RunContext:
             Configuration parameters for run.
         command_argv : list[str] | None, optional
             Command-line arguments, uses sys.argv if None.
+        max_record_tracebacks : int, optional
+            Traceback budget for record-level errors, by default 10.
 
         Returns
         -------
@@ -142,6 +158,7 @@ class RunContext:
             output_dir=output_dir,
             audit_logger=audit_logger,
             manifest_writer=manifest_writer,
+            max_record_tracebacks=max_record_tracebacks,
         )
 
     def start_stage(self, stage_name: str, expected_records: int | None = None) -> None:
@@ -154,7 +171,7 @@ class RunContext:
         expected_records : int | None, optional
             Expected number of records to process.
         """
-        self._stage_start_times[stage_name] = datetime.now(UTC)
+        self._stage_start_ns[stage_name] = time.perf_counter_ns()
 
         stage = StageInfo(
             name=stage_name,
@@ -187,12 +204,12 @@ class RunContext:
         ValueError
             If stage was not started.
         """
-        start_time = self._stage_start_times.pop(stage_name, None)
-        if start_time is None:
+        start_ns = self._stage_start_ns.pop(stage_name, None)
+        if start_ns is None:
             raise ValueError(f"Stage not started: {stage_name}")
 
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         finished_at = get_iso_timestamp()
-        duration = (datetime.now(UTC) - start_time).total_seconds()
 
         self.manifest_writer.finish_stage(
             stage_name=stage_name,
@@ -230,23 +247,31 @@ class RunContext:
         rid : str | None, optional
             Record identifier if error is record-specific.
         include_traceback : bool, optional
-            Whether to include stack trace, by default False.
+            Whether to include stack trace, by default False. Ignored for
+            record-level errors once ``max_record_tracebacks`` is exhausted.
         """
         exception_class = type(exception).__name__
         message = str(exception)
 
+        if include_traceback and rid is not None:
+            # Record-level errors can be numerous; formatting walks every
+            # frame, so only the first few get a traceback.
+            if self._record_tracebacks >= self.max_record_tracebacks:
+                include_traceback = False
+            else:
+                self._record_tracebacks += 1
+
         tb = None
         if include_traceback:
-            if sys.exc_info()[0] is not None:
-                tb = traceback.format_exc()
-            else:
-                tb = "".join(
-                    traceback.format_exception(
-                        type(exception),
-                        exception,
-                        exception.__traceback__,
-                    )
+            import traceback
+
+            tb = "".join(
+                traceback.format_exception(
+                    type(exception),
+                    exception,
+                    exception.__traceback__,
                 )
+            )
 
         error_info = ErrorInfo(
             timestamp=get_iso_timestamp(),
@@ -274,8 +299,8 @@ class RunContext:
     ) -> None:
         """Finish the run and write final manifest.
 
-        Closes the audit logger before computing artifact hashes to ensure
-        the events.jsonl file is complete on disk.
+        Flushes and closes the audit logger before registering events.jsonl,
+        whose hash the logger maintains incrementally while writing.
 
         Parameters
         ----------
@@ -284,7 +309,7 @@ class RunContext:
         records_processed : int | None, optional
             Total records processed.
         """
-        duration = (datetime.now(UTC) - self.start_time).total_seconds()
+        duration = (time.perf_counter_ns() - self._run_start_ns) / 1e9
 
         self.audit_logger.run_finished(
             status=status,
@@ -292,9 +317,12 @@ class RunContext:
             records_processed=records_processed,
         )
 
+        self.audit_logger.flush()
         self.audit_logger.close()
 
-        self.manifest_writer.compute_output_artifacts()
+        self.manifest_writer.compute_output_artifacts(
+            events_digest=self.audit_logger.digest_and_size()
+        )
 
         self.manifest_writer.finish(
             status=status,
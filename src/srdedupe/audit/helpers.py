@@ -1,15 +1,19 @@
 """Helper utilities for audit logging.
 
 Audit-specific utility functions: run ID generation, environment info,
-and git/package/platform information.
+and git/package/platform information. Environment lookups are memoized
+per process since their results do not change during a run.
 
 For timestamp and hashing utilities, see srdedupe.utils.
 """
 
+import os
+import re
 import secrets
-import subprocess
 import sys
 from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
 
 __all__ = [
     "generate_run_id",
@@ -21,6 +25,9 @@ __all__ = [
     "parse_iso_timestamp",
 ]
 
+_MAX_GIT_SEARCH_DEPTH = 20
+_SHA_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
 
 def generate_run_id() -> str:
     """Generate unique run identifier.
@@ -53,14 +60,84 @@ def parse_iso_timestamp(iso_str: str) -> datetime:
     return datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
 
 
+@cache
 def get_git_sha() -> str | None:
     """Get current Git commit SHA if in repository.
 
+    Reads ``.git/HEAD`` (and the ref it points to) directly, falling back
+    to ``git rev-parse HEAD`` for layouts it does not handle, such as
+    worktrees and submodules where ``.git`` is a file. Outside a repository
+    (no ``.git`` found and ``GIT_DIR`` unset) it returns None without
+    spawning git. The result is cached for the lifetime of the process;
+    call ``get_git_sha.cache_clear()`` to force a fresh lookup.
+
     Returns
     -------
     str | None
         Short Git SHA (7 chars) or None if unavailable.
     """
+    git_dir = _find_git_dir(Path.cwd())
+    if git_dir is None and "GIT_DIR" not in os.environ:
+        return None
+
+    sha = _read_head_sha(git_dir) if git_dir is not None else None
+    if sha is None:
+        sha = _git_rev_parse_head()
+    return sha[:7] if sha else None
+
+
+def _find_git_dir(start: Path) -> Path | None:
+    """Return the nearest ``.git`` entry at or above *start*, if any."""
+    for directory in (start, *start.parents[:_MAX_GIT_SEARCH_DEPTH]):
+        candidate = directory / ".git"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _read_head_sha(git_dir: Path) -> str | None:
+    """Resolve HEAD to a full SHA by reading the git directory.
+
+    Parameters
+    ----------
+    git_dir : Path
+        Path to a ``.git`` entry.
+
+    Returns
+    -------
+    str | None
+        Full commit SHA, or None if it cannot be resolved from files.
+    """
+    if not git_dir.is_dir():
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head if _SHA_RE.fullmatch(head) else None
+
+        ref = head[len("ref: ") :]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            sha = ref_path.read_text(encoding="utf-8").strip()
+            return sha if _SHA_RE.fullmatch(sha) else None
+
+        packed_refs = git_dir / "packed-refs"
+        if packed_refs.is_file():
+            for line in packed_refs.read_text(encoding="utf-8").splitlines():
+                sha, _, name = line.partition(" ")
+                if name == ref and _SHA_RE.fullmatch(sha):
+                    return sha
+    except OSError:
+        return None
+
+    return None
+
+
+def _git_rev_parse_head() -> str | None:
+    """Resolve HEAD by running ``git rev-parse HEAD``."""
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -69,12 +146,12 @@ def get_git_sha() -> str | None:
             check=True,
             timeout=5,
         )
-        sha = result.stdout.strip()
-        return sha[:7] if sha else None
+        return result.stdout.strip() or None
     except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
         return None
 
 
+@cache
 def get_package_version() -> str:
     """Get srdedupe package version.
 
@@ -91,6 +168,7 @@ def get_package_version() -> str:
         return "unknown"
 
 
+@cache
 def get_python_version() -> str:
     """Get Python version string.
 
@@ -102,6 +180,7 @@ def get_python_version() -> str:
     return sys.version.split()[0]
 
 
+@cache
 def get_platform_info() -> str:
     """Get platform information.
 
@@ -131,6 +210,12 @@ def get_dependency_versions(packages: list[str]) -> dict[str, str]:
     dict[str, str]
         Mapping of package name to version.
     """
+    return dict(_get_dependency_versions(tuple(packages)))
+
+
+@cache
+def _get_dependency_versions(packages: tuple[str, ...]) -> dict[str, str]:
+    """Look up package versions (memoized; callers must not mutate the result)."""
     import importlib.metadata
 
     versions: dict[str, str] = {}
@@ -1,25 +1,91 @@
 """Structured audit logger for JSONL event logging.
 
-Provides append-only structured event logging to JSONL files with
-a persistent file handle for efficient I/O.
+Provides append-only structured event logging to JSONL files. Events are
+serialized on the caller's thread and handed to a background writer thread
+through a bounded queue, which batches them into a persistent, buffered
+file handle.
 """
 
+import hashlib
 import json
-from dataclasses import asdict
+import queue
+import threading
+import weakref
 from pathlib import Path
 from typing import Any
 
-from srdedupe.audit.models import LogEvent
-from srdedupe.utils import get_iso_timestamp
+from srdedupe.utils import format_sha256, get_iso_timestamp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 __all__ = ["AuditLogger"]
 
+_WRITE_BUFFER_SIZE = 1 << 16
+_QUEUE_MAXSIZE = 10_000
+_WRITE_BATCH_SIZE = 256
+
+
+def _stop_writer(pending: "queue.Queue[bytes | None]", writer: threading.Thread, file: Any) -> None:
+    """Drain the writer thread and close the log file of an unclosed logger.
+
+    Parameters
+    ----------
+    pending : queue.Queue[bytes | None]
+        The logger's event queue.
+    writer : threading.Thread
+        The logger's writer thread.
+    file : Any
+        The logger's open log file handle.
+    """
+    pending.put(None)
+    writer.join()
+    file.close()
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON.
+
+    Uses ``orjson`` when installed, falling back to the stdlib ``json``
+    module. Both decode to the same values, but the bytes are not always
+    identical: float spelling can differ (``0.00001`` vs ``1e-05``,
+    ``1e16`` vs ``1e+16``), and non-finite floats are written as ``null``
+    by ``orjson`` while the fallback rejects them rather than emit the
+    non-standard ``NaN``/``Infinity`` tokens.
+
+    Parameters
+    ----------
+    value : Any
+        JSON-serializable value.
+
+    Returns
+    -------
+    bytes
+        Encoded JSON.
+
+    Raises
+    ------
+    ValueError
+        If ``value`` contains a NaN or infinite float and ``orjson`` is
+        not installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
 
 class AuditLogger:
     """JSONL audit logger with persistent file handle.
 
     Writes structured log events to a JSONL file (one JSON object per line).
-    Events are append-only and flushed after each write for durability.
+    The optional ``stage`` and ``rid`` keys are omitted from events that
+    have none. Events are append-only and written by a background thread; call
+    ``flush()`` (or ``close()``) before reading the file from another handle.
+    When the queue is full, ``event()`` blocks until the writer catches up.
 
     Attributes
     ----------
@@ -46,7 +112,34 @@ class AuditLogger:
         self.current_stage: str | None = None
 
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = self.log_path.open("a", encoding="utf-8")
+        self._file = self.log_path.open("ab", buffering=_WRITE_BUFFER_SIZE)
+
+        # Running digest of the whole file, updated by the writer thread so the
+        # log never has to be re-read to hash it. Appending to an existing file
+        # seeds the digest with its current contents once.
+        self._hasher = hashlib.sha256()
+        self._bytes_written = self._file.tell()
+        if self._bytes_written:
+            with self.log_path.open("rb") as existing:
+                for chunk in iter(lambda: existing.read(_WRITE_BUFFER_SIZE), b""):
+                    self._hasher.update(chunk)
+
+        # Constant envelope pieces, encoded once per logger
+        self._run_id_field = b'","run_id":' + _dumps(run_id)
+        self._encoded_labels: dict[str | None, bytes] = {}
+
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._write_error: BaseException | None = None
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._drain, name="srdedupe-audit-writer", daemon=True
+        )
+        self._writer.start()
+        # A logger that is never closed would otherwise lose the events still
+        # queued for the daemon writer when the interpreter exits.
+        self._finalizer = weakref.finalize(
+            self, _stop_writer, self._queue, self._writer, self._file
+        )
 
     def __enter__(self) -> "AuditLogger":
         """Enter context manager."""
@@ -56,12 +149,101 @@ class AuditLogger:
         """Exit context manager and close file."""
         self.close()
 
+    def flush(self) -> None:
+        """Wait for queued events to be written and flush them to the log file.
+
+        Raises
+        ------
+        Exception
+            The error (e.g. ``OSError``) the background writer hit while
+            writing an event.
+        """
+        if self._closed:
+            return
+        self._queue.join()
+        self._raise_write_error()
+        self._file.flush()
+
     def close(self) -> None:
-        """Flush and close the log file handle."""
-        if not self._file.closed:
-            self._file.flush()
+        """Stop the writer thread, then flush and close the log file handle.
+
+        Raises
+        ------
+        Exception
+            The error (e.g. ``OSError``) the background writer hit while
+            writing an event.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer.detach()
+        self._queue.put(None)
+        self._writer.join()
+        try:
+            self._raise_write_error()
+        finally:
             self._file.close()
 
+    def digest_and_size(self) -> tuple[str, int]:
+        """Return the SHA256 digest and size of the log file.
+
+        Both are maintained incrementally as events are written, so the
+        file is not re-read. Pending events are flushed first.
+
+        Returns
+        -------
+        tuple[str, int]
+            SHA256 hash with "sha256:" prefix, and file size in bytes.
+        """
+        self.flush()
+        return format_sha256(self._hasher.hexdigest()), self._bytes_written
+
+    def _raise_write_error(self) -> None:
+        """Re-raise an error captured by the writer thread."""
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def _drain(self) -> None:
+        """Write queued events in batches until the close sentinel arrives.
+
+        Any error is recorded for ``flush()``/``close()`` to re-raise, and
+        every dequeued item is still marked done, so a failed write can
+        never leave those callers (or a blocked ``event()``) waiting.
+        """
+        while True:
+            item = self._queue.get()
+            taken = 1
+            stop = False
+            try:
+                batch: list[bytes] = []
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= _WRITE_BATCH_SIZE:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    taken += 1
+
+                if batch:
+                    buf = b"".join(batch)
+                    self._file.write(buf)
+                    self._hasher.update(buf)
+                    self._bytes_written += len(buf)
+            except BaseException as exc:
+                if self._write_error is None:
+                    self._write_error = exc
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+            if stop:
+                return
+
     def set_stage(self, stage: str | None) -> None:
         """Set current stage context.
 
@@ -101,30 +283,85 @@ class AuditLogger:
         if stage is None:
             stage = self.current_stage
 
-        log_event = LogEvent(
-            ts=get_iso_timestamp(),
-            run_id=self.run_id,
-            level=level,
-            event=event_type,
-            data=data,
-            stage=stage,
-            rid=rid,
-        )
+        self._write_event(self._encode_event(level, event_type, data, stage, rid))
+
+    def _encode_event(
+        self,
+        level: str,
+        event_type: str,
+        data: dict[str, Any],
+        stage: str | None,
+        rid: str | None,
+    ) -> bytes:
+        """Encode an event envelope as one JSONL line.
+
+        The line is assembled from pre-encoded pieces in ``LogEvent`` field
+        order: the run ID is encoded once per logger and level, event type
+        and stage labels once per distinct value, so only the timestamp,
+        payload and record ID are serialized per event. ``stage`` and ``rid`` are omitted when
+        None. The result matches serializing the envelope dict with compact
+        separators.
+
+        Parameters
+        ----------
+        level : str
+            Log level.
+        event_type : str
+            Event type identifier.
+        data : dict[str, Any]
+            Event-specific data payload.
+        stage : str | None
+            Stage identifier.
+        rid : str | None
+            Record identifier.
+
+        Returns
+        -------
+        bytes
+            JSON line terminated by a newline.
+        """
+        label = self._encode_label
+        parts = [
+            b'{"ts":"',
+            get_iso_timestamp().encode("ascii"),
+            self._run_id_field,
+            b',"level":',
+            label(level),
+            b',"event":',
+            label(event_type),
+            b',"data":',
+            _dumps(data),
+        ]
+        if stage is not None:
+            parts += (b',"stage":', label(stage))
+        if rid is not None:
+            parts += (b',"rid":', _dumps(rid))
+        parts.append(b"}\n")
+        return b"".join(parts)
 
-        self._write_event(log_event)
+    def _encode_label(self, value: str | None) -> bytes:
+        """Encode a low-cardinality label, caching the result."""
+        encoded = self._encoded_labels.get(value)
+        if encoded is None:
+            encoded = self._encoded_labels[value] = _dumps(value)
+        return encoded
 
-    def _write_event(self, event: LogEvent) -> None:
-        """Write event to JSONL file and flush.
+    def _write_event(self, line: bytes) -> None:
+        """Queue an encoded event line for the writer thread.
 
         Parameters
         ----------
-        event : LogEvent
-            Event to write.
+        line : bytes
+            Encoded JSONL line.
+
+        Raises
+        ------
+        ValueError
+            If the logger has been closed.
         """
-        event_dict = asdict(event)
-        json.dump(event_dict, self._file, ensure_ascii=False, separators=(",", ":"))
-        self._file.write("\n")
-        self._file.flush()
+        if self._closed:
+            raise ValueError("I/O operation on closed audit logger")
+        self._queue.put(line)
 
     def run_started(self, command: list[str], parameters: dict[str, Any]) -> None:
         """Log run_started event.
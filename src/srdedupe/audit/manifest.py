@@ -1,6 +1,8 @@
 """Manifest writer for run execution metadata.
 
-Provides atomic manifest writing with O(1) stage lookup.
+Provides atomic manifest writing with O(1) stage lookup. Stages, errors
+and artifacts are serialized to plain dicts when added, so finalizing the
+manifest does not walk the nested dataclasses again.
 """
 
 import json
@@ -83,9 +85,9 @@ class ManifestWriter:
             outputs=OutputsInfo(artifacts=[]),
         )
 
-        self._stage_index: dict[str, StageInfo] = {}
+        self._stage_index: dict[str, dict[str, Any]] = {}
 
-    def _get_stage(self, stage_name: str) -> StageInfo:
+    def _get_stage(self, stage_name: str) -> dict[str, Any]:
         """Look up stage by name (O(1)).
 
         Parameters
@@ -95,8 +97,8 @@ class ManifestWriter:
 
         Returns
         -------
-        StageInfo
-            Stage execution record.
+        dict[str, Any]
+            Serialized stage execution record (mutable in place).
 
         Raises
         ------
@@ -126,8 +128,9 @@ class ManifestWriter:
         stage : StageInfo
             Stage execution record.
         """
-        self.manifest.stages.append(stage)
-        self._stage_index[stage.name] = stage
+        stage_dict = asdict(stage)
+        self.manifest.stages.append(stage_dict)
+        self._stage_index[stage.name] = stage_dict
 
     def update_stage_counters(self, stage_name: str, counters: dict[str, int]) -> None:
         """Update counters for an existing stage.
@@ -144,7 +147,7 @@ class ManifestWriter:
         ValueError
             If stage not found.
         """
-        self._get_stage(stage_name).counters.update(counters)
+        self._get_stage(stage_name)["counters"].update(counters)
 
     def finish_stage(
         self,
@@ -169,8 +172,8 @@ class ManifestWriter:
             If stage not found.
         """
         stage = self._get_stage(stage_name)
-        stage.finished_at = finished_at or get_iso_timestamp()
-        stage.duration_seconds = duration_seconds
+        stage["finished_at"] = finished_at or get_iso_timestamp()
+        stage["duration_seconds"] = duration_seconds
 
     def add_output_artifact(self, artifact: ArtifactInfo) -> None:
         """Add output artifact to manifest.
@@ -180,7 +183,7 @@ class ManifestWriter:
         artifact : ArtifactInfo
             Artifact metadata.
         """
-        self.manifest.outputs.artifacts.append(artifact)
+        self.manifest.outputs.artifacts.append(asdict(artifact))
 
     def add_error(self, error: ErrorInfo) -> None:
         """Add error record to manifest.
@@ -190,7 +193,7 @@ class ManifestWriter:
         error : ErrorInfo
             Error information.
         """
-        self.manifest.errors.append(error)
+        self.manifest.errors.append(asdict(error))
 
     def finish(
         self,
@@ -215,44 +218,171 @@ class ManifestWriter:
 
         self._write_manifest_atomic(self.manifest_path)
 
-    def compute_output_artifacts(self) -> None:
-        """Hash events.jsonl and register as output artifact."""
+    def compute_output_artifacts(self, events_digest: tuple[str, int] | None = None) -> None:
+        """Register events.jsonl as output artifact.
+
+        Parameters
+        ----------
+        events_digest : tuple[str, int] | None, optional
+            Precomputed ``(sha256, bytes)`` of events.jsonl, as returned by
+            ``AuditLogger.digest_and_size()``. When None, the file is hashed
+            from disk.
+        """
         events_path = self.output_dir / "events.jsonl"
 
-        if events_path.exists():
-            self.add_output_artifact(
-                ArtifactInfo(
-                    path="events.jsonl",
-                    sha256=calculate_file_sha256(events_path),
-                    bytes=events_path.stat().st_size,
-                )
-            )
+        if events_digest is not None:
+            sha256, size = events_digest
+        elif events_path.exists():
+            sha256, size = calculate_file_sha256(events_path), events_path.stat().st_size
+        else:
+            return
+
+        self.add_output_artifact(ArtifactInfo(path="events.jsonl", sha256=sha256, bytes=size))
 
     def _write_manifest_atomic(self, path: Path) -> None:
-        """Write manifest atomically: write to temp, fsync, rename.
+        """Write manifest atomically and durably.
+
+        On Linux the manifest is written to an unnamed ``O_TMPFILE`` inode in
+        the output directory, fsynced and then linked into place, so a crash
+        never leaves a stray temporary file behind. Where ``O_TMPFILE`` is not
+        available, it is written to a temporary file, fsynced and renamed.
+        Either way the parent directory is fsynced so the new name is durable.
+
+        The manifest is written as compact JSON; use ``srdedupe audit show``
+        to pretty-print it.
 
         Parameters
         ----------
         path : Path
             Final manifest path.
         """
-        temp_path = path.with_suffix(".tmp")
-        manifest_dict = asdict(self.manifest)
+        manifest_json = json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        payload = manifest_json.encode("utf-8") + b"\n"
 
-        with temp_path.open("w", encoding="utf-8") as f:
-            json.dump(manifest_dict, f, indent=2, ensure_ascii=False)
-            f.write("\n")
-            f.flush()
-            os.fsync(f.fileno())
+        if not _write_via_tmpfile(path, payload):
+            _write_via_rename(path, payload)
 
-        temp_path.replace(path)
+        _fsync_dir(path.parent)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert manifest to dictionary.
 
+        Only the small fixed-shape sections are converted with ``asdict``;
+        stages, errors and artifacts are already stored as dicts.
+
         Returns
         -------
         dict[str, Any]
-            Manifest as dictionary.
+            Manifest as dictionary, in ``ManifestData`` field order.
         """
-        return asdict(self.manifest)
+        manifest = self.manifest
+        return {
+            "manifest_version": manifest.manifest_version,
+            "run_id": manifest.run_id,
+            "created_at": manifest.created_at,
+            "status": manifest.status,
+            "transform_version": manifest.transform_version,
+            "command": asdict(manifest.command),
+            "environment": asdict(manifest.environment),
+            "inputs": asdict(manifest.inputs),
+            "parameters": manifest.parameters,
+            "stages": manifest.stages,
+            "outputs": {"artifacts": manifest.outputs.artifacts},
+            "finished_at": manifest.finished_at,
+            "duration_seconds": manifest.duration_seconds,
+            "errors": manifest.errors,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Atomic write helpers
+# ---------------------------------------------------------------------------
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    """Write all of *payload* to *fd*, retrying on short writes.
+
+    The manifest is serialized to one buffer up front, so this is normally
+    a single ``write`` syscall with no Python file object in between.
+    """
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _write_via_tmpfile(path: Path, payload: bytes) -> bool:
+    """Write *payload* to an ``O_TMPFILE`` inode and link it to *path*.
+
+    Parameters
+    ----------
+    path : Path
+        Final file path.
+    payload : bytes
+        File contents.
+
+    Returns
+    -------
+    bool
+        False if ``O_TMPFILE`` or ``/proc`` linking is unsupported here, in
+        which case nothing was written.
+    """
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is None:
+        return False
+
+    try:
+        fd = os.open(path.parent, o_tmpfile | os.O_WRONLY, 0o644)
+    except OSError:
+        return False
+
+    proc_fd: int | None = None
+    try:
+        _write_all(fd, payload)
+        os.fsync(fd)
+        # linkat(AT_SYMLINK_FOLLOW) on /proc/self/fd/N materializes the inode;
+        # os.link only uses linkat (and honours follow_symlinks) with a dir fd.
+        proc_fd = os.open("/proc/self/fd", os.O_RDONLY)
+        link_src = str(fd)
+        try:
+            os.link(link_src, path, src_dir_fd=proc_fd, follow_symlinks=True)
+        except FileExistsError:
+            # link() never replaces; give the inode a temporary name and
+            # rename it over the existing file instead.
+            temp_path = path.with_suffix(".tmp")
+            temp_path.unlink(missing_ok=True)
+            os.link(link_src, temp_path, src_dir_fd=proc_fd, follow_symlinks=True)
+            temp_path.replace(path)
+    except OSError:
+        return False
+    finally:
+        if proc_fd is not None:
+            os.close(proc_fd)
+        os.close(fd)
+
+    return True
+
+
+def _write_via_rename(path: Path, payload: bytes) -> None:
+    """Write *payload* to a temporary file, fsync it and rename to *path*."""
+    temp_path = path.with_suffix(".tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    temp_path.replace(path)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Fsync *directory* so renames and links in it are durable."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms that cannot open directories
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(dir_fd)
@@ -21,7 +21,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandInfo:
     """Command-line information.
 
@@ -37,7 +37,7 @@ class CommandInfo:
     cwd: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentInfo:
     """Execution environment information.
 
@@ -59,7 +59,7 @@ class EnvironmentInfo:
     dependencies: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Input file metadata.
 
@@ -87,7 +87,7 @@ class FileInfo:
     mtime: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InputsInfo:
     """Input files inventory.
 
@@ -106,7 +106,7 @@ class InputsInfo:
     total_records_extracted: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactInfo:
     """Output artifact metadata.
 
@@ -128,7 +128,7 @@ class ArtifactInfo:
     record_count: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StageInfo:
     """Stage execution information.
 
@@ -156,7 +156,7 @@ class StageInfo:
     artifacts: list[ArtifactInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorInfo:
     """Error record.
 
@@ -184,20 +184,20 @@ class ErrorInfo:
     rid: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputsInfo:
     """Output artifacts inventory.
 
     Attributes
     ----------
-    artifacts : list[ArtifactInfo]
-        List of output artifacts.
+    artifacts : list[dict[str, Any]]
+        Output artifacts, stored as serialized ``ArtifactInfo`` dicts.
     """
 
-    artifacts: list[ArtifactInfo] = field(default_factory=list)
+    artifacts: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManifestData:
     """Complete run manifest.
 
@@ -221,16 +221,16 @@ class ManifestData:
         Input files inventory.
     parameters : dict[str, Any]
         Configuration snapshot.
-    stages : list[StageInfo]
-        Stage execution records.
+    stages : list[dict[str, Any]]
+        Stage execution records, stored as serialized ``StageInfo`` dicts.
     outputs : OutputsInfo
         Output artifacts inventory.
     finished_at : str | None
         ISO8601 UTC timestamp when run finished.
     duration_seconds : float | None
         Total execution time.
-    errors : list[ErrorInfo]
-        Error records.
+    errors : list[dict[str, Any]]
+        Error records, stored as serialized ``ErrorInfo`` dicts.
     """
 
     manifest_version: str
@@ -242,14 +242,14 @@ class ManifestData:
     environment: EnvironmentInfo
     inputs: InputsInfo
     parameters: dict[str, Any]
-    stages: list[StageInfo]
+    stages: list[dict[str, Any]]
     outputs: OutputsInfo
     finished_at: str | None = None
     duration_seconds: float | None = None
-    errors: list[ErrorInfo] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
     """Structured log event.
 
@@ -266,9 +266,9 @@ class LogEvent:
     data : dict[str, Any]
         Event-specific data payload.
     stage : str | None
-        Current stage identifier.
+        Current stage identifier (omitted from the JSONL line when None).
     rid : str | None
-        Record identifier if event is record-specific.
+        Record identifier if event is record-specific (omitted when None).
     """
 
     ts: str
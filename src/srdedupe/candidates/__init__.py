@@ -6,11 +6,13 @@ from srdedupe.candidates.blockers import (
     BibYearPM1TitlePrefixBlocker,
     Blocker,
     BlockerStats,
+    ColumnBlocker,
     DOIExactBlocker,
     MinHashLSHTitleBlocker,
     PMIDExactBlocker,
     SimHashTitleBlocker,
     StatefulBlocker,
+    TitleTokenBlocker,
 )
 from srdedupe.candidates.factory import (
     BLOCKER_REGISTRY,
@@ -24,7 +26,9 @@ __all__ = [
     # Protocol
     "Blocker",
     "BlockerStats",
+    "ColumnBlocker",
     "StatefulBlocker",
+    "TitleTokenBlocker",
     # Exact blockers
     "DOIExactBlocker",
     "PMIDExactBlocker",
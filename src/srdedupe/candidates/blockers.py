@@ -10,23 +10,25 @@ Architecture
 * Pure functions for hashing / tokenisation (no hidden state).
 * Stateful blockers (e.g. ``BibRareTitleTokensBlocker``) expose an
   explicit ``initialize()`` hook called by the generator before keying.
+* Title-token blockers also expose ``title_token_keys()`` so the
+  generator can tokenise each title once and share it between them.
 """
 
 from __future__ import annotations
 
 import hashlib
+import heapq
 from collections import Counter
 from collections.abc import Iterable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import Protocol, runtime_checkable
 
-from srdedupe.models.records import CanonicalRecord
-
-try:
-    from datasketch import MinHash
-except ImportError:  # pragma: no cover
-    MinHash = None
+import numpy as np
 
+from srdedupe.models.records import CanonicalRecord
 
 # ============================================================================
 # Constants
@@ -37,6 +39,9 @@ MINHASH_BANDS = 16
 MINHASH_MIN_TOKENS = 3
 MINHASH_SEED = 42
 
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH32 = np.uint64((1 << 32) - 1)
+
 SIMHASH_BITS = 64
 SIMHASH_CHUNKS = 4
 SIMHASH_MIN_TOKENS = 5
@@ -48,6 +53,8 @@ RARE_TOKEN_DF_MAX_RATIO = 0.01
 
 MIN_TOKEN_LEN = 3
 
+TOKEN_HASH_CACHE_SIZE = 1 << 18
+
 YEAR_OFFSETS = (-1, 0, 1)
 
 
@@ -56,7 +63,7 @@ YEAR_OFFSETS = (-1, 0, 1)
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockerStats:
     """Counters collected while running a single blocker.
 
@@ -88,7 +95,15 @@ class BlockerStats:
 
     def to_dict(self) -> dict[str, int]:
         """Serialise to a plain dict."""
-        return asdict(self)
+        return {
+            "records_seen": self.records_seen,
+            "records_keyed": self.records_keyed,
+            "unique_keys": self.unique_keys,
+            "blocks_gt1": self.blocks_gt1,
+            "pairs_raw": self.pairs_raw,
+            "pairs_unique": self.pairs_unique,
+            "max_block": self.max_block,
+        }
 
 
 # ============================================================================
@@ -139,42 +154,117 @@ class StatefulBlocker(Protocol):
         ...
 
 
+class ColumnBlocker(Protocol):
+    """Extension for blockers that derive at most one key per record.
+
+    The generator reads the whole key column in one pass instead of
+    calling ``block_keys`` record by record; both must agree.
+    """
+
+    def key_column(self, records: list[CanonicalRecord]) -> list[str | None]:
+        """Return each record's blocking key, or ``None``/``""`` when absent.
+
+        Parameters
+        ----------
+        records : list[CanonicalRecord]
+            Records to key, in the order the result is aligned to.
+        """
+        ...
+
+
+class TitleTokenBlocker(Protocol):
+    """Extension for blockers keyed on a record's title tokens.
+
+    The generator tokenises each record's title once and offers the
+    tokens to every blocker implementing this protocol, instead of each
+    one re-tokenising in ``block_keys``; both must agree.
+    """
+
+    def title_token_keys(self, record: CanonicalRecord, tokens: list[str]) -> Iterable[str]:
+        """Yield blocking keys for *record* given its ``title_tokens``.
+
+        Parameters
+        ----------
+        record : CanonicalRecord
+            Record to key.
+        tokens : list[str]
+            ``title_tokens(record)``; must not be mutated.
+        """
+        ...
+
+
 # ============================================================================
 # Pure helpers
 # ============================================================================
 
 
+@lru_cache(maxsize=TOKEN_HASH_CACHE_SIZE)
 def _deterministic_hash(value: str, seed: int = 0) -> int:
-    """SHA-256 based hash immune to Python's ``PYTHONHASHSEED``."""
-    digest = hashlib.sha256(f"{seed}:{value}".encode()).digest()
-    return int.from_bytes(digest[:8], "big")
+    """64-bit BLAKE2b hash immune to Python's ``PYTHONHASHSEED``.
+
+    Non-zero seeds key the hash; the default seed skips keying, which is
+    the cheapest BLAKE2b call per token. Title vocabularies repeat
+    heavily across a corpus, so results are memoised: each distinct token
+    is encoded and hashed once and shared by the MinHash and SimHash
+    blockers.
+    """
+    if seed == 0:
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    else:
+        key = seed.to_bytes(8, "big")
+        digest = hashlib.blake2b(value.encode(), digest_size=8, key=key).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _short_hash(value: bytes) -> str:
+    """Return a 16-hex-digit BLAKE2b digest of *value*."""
+    return hashlib.blake2b(value, digest_size=8).hexdigest()
 
 
 def _compute_simhash(tokens: list[str], bits: int = SIMHASH_BITS) -> int:
     """Standard SimHash using deterministic token hashes."""
-    vector = [0] * bits
-    for token in tokens:
-        h = _deterministic_hash(token)
-        for i in range(bits):
-            vector[i] += 1 if (h >> i) & 1 else -1
+    hashes = np.fromiter(
+        (_deterministic_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens)
+    )
+    return _simhash_from_hashes(hashes, bits)
+
+
+def _simhash_from_hashes(hashes: np.ndarray, bits: int) -> int:
+    """Fold 64-bit token hashes into a *bits*-wide SimHash fingerprint.
 
-    fingerprint = 0
-    for i in range(bits):
-        if vector[i] > 0:
-            fingerprint |= 1 << i
-    return fingerprint
+    The hashes' little-endian bytes are unpacked into an
+    ``(n_tokens, 64)`` 0/1 matrix with no per-bit branching and reduced
+    column-wise; bit ``i`` of the fingerprint is set when more than half
+    of the tokens have it set. Bits beyond the 64-bit token hash are
+    never set.
+    """
+    token_bits = np.unpackbits(hashes.astype("<u8").view(np.uint8), bitorder="little")
+    set_counts = token_bits.reshape(-1, 64)[:, :bits].sum(axis=0, dtype=np.int64)
+    majority = 2 * set_counts > len(hashes)
+    return int.from_bytes(np.packbits(majority, bitorder="little").tobytes(), "little")
+
+
+@cache
+def _year_window_prefixes(year: int) -> tuple[str, ...]:
+    """Return the ``y{year}:`` key prefixes for every offset in ``YEAR_OFFSETS``.
+
+    Years repeat heavily across a corpus, so the window prefixes are
+    formatted once per year and keys are built by plain concatenation.
+    """
+    return tuple(f"y{year + offset}:" for offset in YEAR_OFFSETS)
 
 
-def _title_tokens(record: CanonicalRecord, min_len: int = MIN_TOKEN_LEN) -> list[str]:
-    """Extract title tokens, preferring pre-computed shingles."""
-    shingles = record.keys.title_shingles
-    if shingles is not None and len(shingles) > 0:
-        return shingles
+def title_tokens(record: CanonicalRecord, min_len: int = MIN_TOKEN_LEN) -> list[str]:
+    """Extract title tokens, preferring pre-computed shingles.
 
+    Callers must not mutate the returned list: it may be the record's own
+    ``title_shingles``.
+    """
+    tokens = record.keys.title_shingles
+    if tokens:
+        return tokens
     text = record.canon.title_norm_basic
-    if not text:
-        return []
-    return [t for t in text.split() if len(t) >= min_len]
+    return [t for t in text.split() if len(t) >= min_len] if text else []
 
 
 # ============================================================================
@@ -194,6 +284,10 @@ class DOIExactBlocker:
         if doi:
             yield doi
 
+    def key_column(self, records: list[CanonicalRecord]) -> list[str | None]:
+        """Return the normalised DOI of every record."""
+        return [record.canon.doi_norm for record in records]
+
 
 class PMIDExactBlocker:
     """Block by normalised PMID."""
@@ -207,6 +301,10 @@ class PMIDExactBlocker:
         if pmid:
             yield pmid
 
+    def key_column(self, records: list[CanonicalRecord]) -> list[str | None]:
+        """Return the normalised PMID of every record."""
+        return [record.canon.pmid_norm for record in records]
+
 
 # ============================================================================
 # Lexical / fuzzy blockers
@@ -235,36 +333,45 @@ class MinHashLSHTitleBlocker:
         bands: int = MINHASH_BANDS,
         min_tokens: int = MINHASH_MIN_TOKENS,
     ) -> None:
-        if MinHash is None:
-            raise ImportError(
-                "datasketch is required for MinHashLSHTitleBlocker. "
-                "Install with: pip install datasketch>=1.6.0"
-            )
         self.num_perm = num_perm
         self.bands = bands
         self.rows_per_band = num_perm // bands
         self.min_tokens = min_tokens
+        gen = np.random.RandomState(MINHASH_SEED)
+        self._perm_a = gen.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._perm_b = gen.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
 
     def block_keys(self, record: CanonicalRecord) -> Iterable[str]:
         """Yield one band-hash key per LSH band."""
-        if record.flags.title_missing:
-            return
+        return self.title_token_keys(record, title_tokens(record))
 
-        tokens = _title_tokens(record)
-        if len(tokens) < self.min_tokens:
+    def title_token_keys(self, record: CanonicalRecord, tokens: list[str]) -> Iterable[str]:
+        """Yield one band-hash key per LSH band from pre-extracted tokens."""
+        if record.flags.title_missing or len(tokens) < self.min_tokens:
             return
 
-        mh = MinHash(num_perm=self.num_perm, seed=MINHASH_SEED)
-        for token in tokens:
-            mh.update(token.encode("utf-8"))
-
-        hv = mh.hashvalues
+        sig = self._signature(tokens).astype(np.uint32)
+        rows = self.rows_per_band
         for band in range(self.bands):
-            start = band * self.rows_per_band
-            band_bytes = ",".join(map(str, hv[start : start + self.rows_per_band]))
-            band_hash = hashlib.sha256(band_bytes.encode("utf-8")).hexdigest()[:16]
+            band_hash = _short_hash(sig[band * rows : (band + 1) * rows].tobytes())
             yield f"mh:b{band}:{band_hash}"
 
+    def _signature(self, tokens: list[str]) -> np.ndarray:
+        """Return the ``num_perm`` MinHash values of *tokens*.
+
+        Each token is hashed once to 32 bits; all universal-hash
+        permutations ``(a * h + b) mod p`` are then applied with one
+        ``(n_tokens, num_perm)`` broadcast and reduced by column minima.
+        """
+        hashes = np.fromiter(
+            (_deterministic_hash(t) for t in tokens), dtype=np.uint64, count=len(tokens)
+        )
+        hashes &= _MAX_HASH32
+        perms = (hashes[:, None] * self._perm_a + self._perm_b) % _MERSENNE_PRIME
+        perms &= _MAX_HASH32
+        signature: np.ndarray = perms.min(axis=0)
+        return signature
+
 
 class SimHashTitleBlocker:
     """Block by SimHash fingerprint chunks.
@@ -295,11 +402,11 @@ class SimHashTitleBlocker:
 
     def block_keys(self, record: CanonicalRecord) -> Iterable[str]:
         """Yield one key per fingerprint chunk."""
-        if record.flags.title_missing:
-            return
+        return self.title_token_keys(record, title_tokens(record))
 
-        tokens = _title_tokens(record)
-        if len(tokens) < self.min_tokens:
+    def title_token_keys(self, record: CanonicalRecord, tokens: list[str]) -> Iterable[str]:
+        """Yield one key per fingerprint chunk from pre-extracted tokens."""
+        if record.flags.title_missing or len(tokens) < self.min_tokens:
             return
 
         fp = _compute_simhash(tokens, self.bits)
@@ -328,8 +435,8 @@ class BibYearPM1FirstAuthorBlocker:
         author = record.canon.first_author_sig
         if year is None or not author:
             return
-        for offset in YEAR_OFFSETS:
-            yield f"y{year + offset}:{author}"
+        for prefix in _year_window_prefixes(year):
+            yield prefix + author
 
 
 class BibYearPM1TitlePrefixBlocker:
@@ -347,9 +454,9 @@ class BibYearPM1TitlePrefixBlocker:
         title = record.keys.title_key_strict
         if year is None or not title:
             return
-        prefix = title[: self.prefix_len]
-        for offset in YEAR_OFFSETS:
-            yield f"y{year + offset}:tp{prefix}"
+        title_prefix = "tp" + title[: self.prefix_len]
+        for prefix in _year_window_prefixes(year):
+            yield prefix + title_prefix
 
 
 class BibRareTitleTokensBlocker:
@@ -376,6 +483,8 @@ class BibRareTitleTokensBlocker:
         self.df_max_ratio = df_max_ratio
         self._token_df: Counter[str] | None = None
         self._total_docs: int = 0
+        self._rare_df: dict[str, int] = {}
+        self._rare_df_max: int | None = None
 
     @property
     def token_df(self) -> Counter[str] | None:
@@ -388,23 +497,34 @@ class BibRareTitleTokensBlocker:
         return self._total_docs
 
     def initialize(self, records: list[CanonicalRecord]) -> None:
-        """Compute document frequencies across the corpus."""
-        df: Counter[str] = Counter()
-        total = 0
-        for record in records:
-            if record.flags.title_missing:
-                continue
-            tokens = _title_tokens(record)
-            if tokens:
-                for t in set(tokens):
-                    df[t] += 1
-                total += 1
-        self._token_df = df
-        self._total_docs = total
+        """Compute document frequencies across the corpus.
+
+        Per-document token sets are chained into a single
+        ``Counter.update`` call, which counts in C rather than through one
+        Python-level increment per token.
+        """
+        docs = [
+            set(tokens)
+            for record in records
+            if not record.flags.title_missing and (tokens := title_tokens(record))
+        ]
+        self._token_df = Counter(chain.from_iterable(docs))
+        self._total_docs = len(docs)
+        self._rare_df_max = None
 
     def block_keys(self, record: CanonicalRecord) -> Iterable[str]:
         """Yield keys for the *k* rarest tokens in the record.
 
+        Raises
+        ------
+        RuntimeError
+            If ``initialize()`` has not been called.
+        """
+        return self.title_token_keys(record, title_tokens(record))
+
+    def title_token_keys(self, record: CanonicalRecord, tokens: list[str]) -> Iterable[str]:
+        """Yield keys for the *k* rarest of the pre-extracted tokens.
+
         Raises
         ------
         RuntimeError
@@ -413,18 +533,25 @@ class BibRareTitleTokensBlocker:
         if self._token_df is None:
             raise RuntimeError("initialize() must be called before block_keys()")
 
-        if record.flags.title_missing:
+        if record.flags.title_missing or not tokens:
             return
 
-        tokens = _title_tokens(record)
-        if not tokens:
-            return
-
-        max_df = int(self._total_docs * self.df_max_ratio)
-        rare = [
-            (t, self._token_df.get(t, 0)) for t in tokens if 0 < self._token_df.get(t, 0) <= max_df
-        ]
-        rare.sort(key=lambda x: x[1])
+        rare_df = self._rare_table(self._token_df)
+        rare = [(t, df) for t in tokens if (df := rare_df.get(t))]
+        rarest = heapq.nsmallest(self.k, rare, key=itemgetter(1))
 
-        for token in sorted(t for t, _ in rare[: self.k]):
+        for token in sorted(t for t, _ in rarest):
             yield f"rt:{token}"
+
+    def _rare_table(self, token_df: Counter[str]) -> dict[str, int]:
+        """Return the DF of tokens that pass the rarity cut-off.
+
+        The cut-off depends only on corpus size and ``df_max_ratio``, so
+        the filtered table is built once (and rebuilt if the ratio
+        changes) and ``block_keys`` needs a single probe per token.
+        """
+        max_df = int(self._total_docs * self.df_max_ratio)
+        if self._rare_df_max != max_df:
+            self._rare_df = {t: df for t, df in token_df.items() if 0 < df <= max_df}
+            self._rare_df_max = max_df
+        return self._rare_df
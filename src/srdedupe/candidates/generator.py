@@ -8,21 +8,33 @@ from __future__ import annotations
 
 import json
 import time
-from collections import defaultdict
-from collections.abc import Iterable
-from itertools import combinations
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from itertools import pairwise, repeat
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from srdedupe.audit.logger import AuditLogger
-from srdedupe.candidates.blockers import Blocker, BlockerStats
-from srdedupe.candidates.models import CandidatePair, CandidateSource
+from srdedupe.candidates.blockers import Blocker, BlockerStats, title_tokens
+from srdedupe.candidates.models import CandidateSource
 from srdedupe.models.records import CanonicalRecord
 from srdedupe.utils import calculate_file_sha256
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_MAX_BLOCK_SIZE = 1000
+MAX_OVERSIZED_BLOCK_EVENTS = 100
 STAGE_NAME = "candidate_generation"
 
+_PAIR_SHIFT = np.uint64(32)
+_PAIR_MASK = (1 << 32) - 1
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def generate_candidates(
     blockers: list[Blocker],
@@ -45,7 +57,9 @@ def generate_candidates(
     logger : AuditLogger | None, optional
         Audit logger for observability events.
     max_block_size : int, optional
-        Log a warning when a block exceeds this size.
+        Log a warning when a block exceeds this size. At most
+        ``MAX_OVERSIZED_BLOCK_EVENTS`` warnings are logged per blocker;
+        any further oversized blocks are reported in one summary event.
 
     Returns
     -------
@@ -66,19 +80,25 @@ def generate_candidates(
         if hasattr(blocker, "initialize"):
             blocker.initialize(records_list)
 
-    # Run all blockers and aggregate pairs
+    # Intern rids as ints whose order matches the rid string order, so a
+    # pair is a single packed integer ``(a << 32) | b`` with ``a < b``.
+    rids = sorted({record.rid for record in records_list})
+    rid_to_int = {rid: i for i, rid in enumerate(rids)}
+
+    # Key every record against every blocker in one pass, then emit pairs
     stats: dict[str, BlockerStats] = {}
-    pair_sources: dict[str, list[CandidateSource]] = defaultdict(list)
+    pair_sources: dict[int, list[CandidateSource]] = defaultdict(list)
 
-    for blocker in sorted_blockers:
-        blocker_stats, blocker_pairs = _run_blocker(blocker, records_list, max_block_size, logger)
+    indexes = _index_records(sorted_blockers, records_list, rid_to_int)
+    for blocker, (blocker_stats, index) in zip(sorted_blockers, indexes, strict=True):
+        blocker_pairs = _emit_pairs(blocker, blocker_stats, index, max_block_size, logger)
         stats[blocker.name] = blocker_stats
 
         for pair_id, source in blocker_pairs.items():
             pair_sources[pair_id].append(source)
 
     # Write deterministic JSONL
-    _write_jsonl(pair_sources, output_path)
+    _write_jsonl(pair_sources, rids, output_path)
 
     # Global stats
     global_stats = {
@@ -123,86 +143,250 @@ def generate_candidates(
 # ---------------------------------------------------------------------------
 
 
-def _run_blocker(
-    blocker: Blocker,
+def _index_records(
+    blockers: list[Blocker],
     records: list[CanonicalRecord],
-    max_block_size: int,
-    logger: AuditLogger | None,
-) -> tuple[BlockerStats, dict[str, CandidateSource]]:
-    """Index records by blocker keys, then emit pairs from each block."""
-    stats = BlockerStats()
+    rid_to_int: dict[str, int],
+) -> list[tuple[BlockerStats, dict[str, list[int]]]]:
+    """Build one inverted index (key → [rid id, …]) per blocker.
+
+    Records are traversed once; each record is offered to every blocker
+    in turn, so the record list is walked once regardless of how many
+    blockers are configured. ``block_keys`` methods are bound once up
+    front and keyed-record counts kept in a local list, keeping attribute
+    lookups out of the per-record loop.
+
+    Records are visited in rid order, so every block's member list is
+    built already sorted and is deduplicated on insert by comparing with
+    its last element. Blockers exposing ``key_column`` (see
+    ``ColumnBlocker``) skip the per-record loop and are grouped as a
+    whole column by ``_group_column``. Each record's title is tokenised
+    once and shared by every ``TitleTokenBlocker``.
+    """
+    ordered = sorted(records, key=lambda r: r.rid)
+    rid_ids = [rid_to_int[record.rid] for record in ordered]
+
+    indexes: list[tuple[BlockerStats, dict[str, list[int]]]] = [
+        (BlockerStats(records_seen=len(records)), defaultdict(list)) for _ in blockers
+    ]
+    keyed_counts = [0] * len(blockers)
+    keyers: list[tuple[int, Callable[..., Iterable[str]], bool, dict[str, list[int]]]] = []
+
+    for i, (blocker, (_, index)) in enumerate(zip(blockers, indexes, strict=True)):
+        key_column = getattr(blocker, "key_column", None)
+        if key_column is not None:
+            _group_column(key_column(ordered), rid_ids, indexes[i])
+            continue
+        title_token_keys = getattr(blocker, "title_token_keys", None)
+        if title_token_keys is None:
+            keyers.append((i, blocker.block_keys, False, index))
+        else:
+            keyers.append((i, title_token_keys, True, index))
+
+    wants_tokens = any(uses_tokens for _, _, uses_tokens, _ in keyers)
+    if keyers:
+        tokens: list[str] = []
+        for rid, record in zip(rid_ids, ordered, strict=True):
+            if wants_tokens:
+                tokens = title_tokens(record)
+            for i, keys_of, uses_tokens, index in keyers:
+                keyed = False
+                for key in keys_of(record, tokens) if uses_tokens else keys_of(record):
+                    members = index[key]
+                    if not members or members[-1] != rid:
+                        members.append(rid)
+                    keyed = True
+                if keyed:
+                    keyed_counts[i] += 1
+
+    for i, _, _, index in keyers:
+        stats = indexes[i][0]
+        stats.records_keyed = keyed_counts[i]
+        stats.unique_keys = len(index)
+    return indexes
+
+
+def _group_column(
+    column: list[str | None],
+    rid_ids: list[int],
+    entry: tuple[BlockerStats, dict[str, list[int]]],
+) -> None:
+    """Group a one-key-per-record column into *entry*'s inverted index.
 
-    # Phase 1 — build inverted index: key → [rid, …]
-    index: dict[str, list[str]] = defaultdict(list)
+    Keys are counted in C with ``Counter`` first; member lists are only
+    built for keys shared by two or more records, since singleton blocks
+    never yield pairs. Exact identifiers are mostly unique, so this skips
+    almost every list allocation while the stats still count every key.
+    """
+    stats, index = entry
+    counts = Counter(column)
+    counts.pop(None, None)
+    counts.pop("", None)
+    stats.records_keyed = counts.total()
+    stats.unique_keys = len(counts)
 
-    for record in records:
-        stats.records_seen += 1
-        keys = list(blocker.block_keys(record))
-        if not keys:
-            continue
-        stats.records_keyed += 1
-        for key in keys:
-            index[key].append(record.rid)
+    for rid, key in zip(rid_ids, column, strict=True):
+        if key and counts[key] > 1:
+            members = index[key]
+            if not members or members[-1] != rid:
+                members.append(rid)
 
-    stats.unique_keys = len(index)
 
-    # Phase 2 — emit candidate pairs from blocks with ≥ 2 records
-    unique_pairs: dict[str, CandidateSource] = {}
+def _emit_pairs(
+    blocker: Blocker,
+    stats: BlockerStats,
+    index: dict[str, list[int]],
+    max_block_size: int,
+    logger: AuditLogger | None,
+) -> dict[int, CandidateSource]:
+    """Emit packed candidate pairs from every block of *index* with ≥ 2 records.
+
+    Each block's pairs are generated at once from the upper triangle of
+    its (already sorted, unique) member ids. The first block (in key order) that produces a
+    pair is its source, so blocks are merged into the result in reverse
+    key order with bulk ``dict.update`` calls, letting earlier blocks
+    overwrite later ones.
+    """
+    blocks: list[tuple[np.ndarray, CandidateSource]] = []
+    oversized = 0
 
     for block_key in sorted(index):
-        rids = sorted(set(index[block_key]))
-        block_size = len(rids)
-
+        block_size = len(index[block_key])
         if block_size < 2:
             continue
+        ids = np.array(index[block_key], dtype=np.uint64)
 
         stats.blocks_gt1 += 1
         stats.max_block = max(stats.max_block, block_size)
 
         if block_size > max_block_size and logger:
-            logger.event(
-                "oversized_block",
-                data={
-                    "blocker": blocker.name,
-                    "block_key": block_key[:100],
-                    "block_size": block_size,
-                    "max_block_size": max_block_size,
-                },
-                level="WARN",
-                stage=STAGE_NAME,
-            )
+            oversized += 1
+            if oversized <= MAX_OVERSIZED_BLOCK_EVENTS:
+                logger.event(
+                    "oversized_block",
+                    data={
+                        "blocker": blocker.name,
+                        "block_key": block_key[:100],
+                        "block_size": block_size,
+                        "max_block_size": max_block_size,
+                    },
+                    level="WARN",
+                    stage=STAGE_NAME,
+                )
 
         source = CandidateSource(
             blocker=blocker.name,
             block_key=block_key,
             match_key=blocker.match_key,
         )
+        upper, lower = np.triu_indices(block_size, 1)
+        blocks.append(((ids[upper] << _PAIR_SHIFT) | ids[lower], source))
+        stats.pairs_raw += len(upper)
+
+    if logger and oversized > MAX_OVERSIZED_BLOCK_EVENTS:
+        logger.event(
+            "oversized_blocks_suppressed",
+            data={
+                "blocker": blocker.name,
+                "oversized_blocks": oversized,
+                "suppressed": oversized - MAX_OVERSIZED_BLOCK_EVENTS,
+                "max_block_size": max_block_size,
+            },
+            level="WARN",
+            stage=STAGE_NAME,
+        )
 
-        for rid_a, rid_b in combinations(rids, 2):
-            pair_id = f"{rid_a}|{rid_b}"  # rids already sorted
-            stats.pairs_raw += 1
-            if pair_id not in unique_pairs:
-                unique_pairs[pair_id] = source
+    unique_pairs: dict[int, CandidateSource] = {}
+    for packed, source in reversed(blocks):
+        unique_pairs.update(zip(packed.tolist(), repeat(source)))
 
     stats.pairs_unique = len(unique_pairs)
-    return stats, unique_pairs
+    return unique_pairs
 
 
 def _write_jsonl(
-    pair_sources: dict[str, list[CandidateSource]],
+    pair_sources: dict[int, list[CandidateSource]],
+    rids: list[str],
     output_path: Path,
 ) -> None:
-    """Write candidate pairs as deterministic JSONL."""
+    """Write candidate pairs as deterministic JSONL, ordered by ``pair_id``.
+
+    When no rid is a prefix of another, ``"a|b"`` strings order exactly
+    like the packed ``(a, b)`` ints, so pairs are sorted as ints and each
+    ``pair_id`` is formatted once, as its line is written. Otherwise the
+    ``|`` separator can reorder pairs sharing a prefix, and the strings
+    are built up front to sort by.
+
+    Each line is the JSON form of a ``CandidatePair``, assembled from
+    pieces encoded once rather than per pair: every rid is encoded up
+    front and every ``CandidateSource`` (shared by all pairs of its
+    block) on first use. ``|`` needs no escaping, so ``pair_id`` is the
+    two encoded rids joined inside one pair of quotes. Pieces are
+    encoded with ``orjson`` when it is installed, falling back to compact
+    stdlib ``json``; both produce identical bytes.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as fh:
-        for pair_id in sorted(pair_sources):
-            rid_a, rid_b = pair_id.split("|")
-            pair = CandidatePair(
-                pair_id=pair_id,
-                rid_a=rid_a,
-                rid_b=rid_b,
-                sources=pair_sources[pair_id],
+    order: Iterable[int]
+    if _prefix_free(rids):
+        order = sorted(pair_sources)
+    else:
+        pair_ids = {
+            packed: f"{rids[packed >> 32]}|{rids[packed & _PAIR_MASK]}" for packed in pair_sources
+        }
+        order = sorted(pair_ids, key=pair_ids.__getitem__)
+
+    encoded_rids = [_encode_json(rid) for rid in rids]
+    # Sources are unhashable dataclasses shared across a block's pairs, and
+    # all stay alive in *pair_sources*, so their ids are stable cache keys.
+    encoded_sources: dict[int, bytes] = {}
+
+    with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        for packed in order:
+            rid_a = encoded_rids[packed >> 32]
+            rid_b = encoded_rids[packed & _PAIR_MASK]
+            sources = []
+            for source in pair_sources[packed]:
+                encoded = encoded_sources.get(id(source))
+                if encoded is None:
+                    encoded = encoded_sources[id(source)] = _encode_json(source.to_dict())
+                sources.append(encoded)
+            fh.write(
+                b"".join(
+                    (
+                        b'{"pair_id":',
+                        rid_a[:-1],
+                        b"|",
+                        rid_b[1:],
+                        b',"rid_a":',
+                        rid_a,
+                        b',"rid_b":',
+                        rid_b,
+                        b',"sources":[',
+                        b",".join(sources),
+                        b"]}\n",
+                    )
+                )
             )
-            json.dump(pair.to_dict(), fh, ensure_ascii=False, separators=(",", ":"))
-            fh.write("\n")
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode *value* as compact UTF-8 JSON, with ``orjson`` when available.
+
+    The stdlib fallback decodes to the same values but may spell floats
+    differently, and it rejects NaN/infinity where ``orjson`` writes ``null``.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _prefix_free(sorted_rids: list[str]) -> bool:
+    """Return True when no rid in *sorted_rids* is a prefix of another.
+
+    A prefix sorts immediately before the strings it prefixes, so
+    checking neighbours is enough.
+    """
+    return not any(b.startswith(a) for a, b in pairwise(sorted_rids))
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateSource:
     """Provenance information for a candidate pair.
 
@@ -26,8 +26,22 @@ class CandidateSource:
     block_key: str
     match_key: str
 
+    def to_dict(self) -> dict[str, str]:
+        """Convert to dictionary for JSON serialization.
+
+        Returns
+        -------
+        dict
+            Dictionary representation of the source.
+        """
+        return {
+            "blocker": self.blocker,
+            "block_key": self.block_key,
+            "match_key": self.match_key,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class CandidatePair:
     """A candidate duplicate pair with provenance.
 
@@ -65,12 +79,5 @@ class CandidatePair:
             "pair_id": self.pair_id,
             "rid_a": self.rid_a,
             "rid_b": self.rid_b,
-            "sources": [
-                {
-                    "blocker": s.blocker,
-                    "block_key": s.block_key,
-                    "match_key": s.match_key,
-                }
-                for s in self.sources
-            ],
+            "sources": [s.to_dict() for s in self.sources],
         }
@@ -3,22 +3,57 @@
 Provides CLI commands for deduplication pipeline.
 """
 
-import importlib.metadata
 import sys
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
+if TYPE_CHECKING:
+    from srdedupe.models import CanonicalRecord
+
 __all__ = ["cli"]
 
-try:
-    __version__ = importlib.metadata.version("srdedupe")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.1.0"  # Fallback for development
+
+def _package_version() -> str:
+    """Return the installed package version.
+
+    ``importlib.metadata`` costs about as much to import as ``click``, so
+    it is only loaded when a version is actually requested.
+    """
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("srdedupe")
+    except importlib.metadata.PackageNotFoundError:
+        return "0.1.0"  # Fallback for development
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` lazily on first attribute access."""
+    if name == "__version__":
+        return _package_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Print the version and exit, for the eager ``--version`` flag."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"srdedupe, version {_package_version()}")
+    ctx.exit()
 
 
 @click.group()
-@click.version_option(version=__version__, prog_name="srdedupe")
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 def cli() -> None:
     """Safe, reproducible deduplication for bibliographic references.
 
@@ -66,7 +101,7 @@ def parse(
         srdedupe parse references.ris -o output.jsonl
         srdedupe parse data/ -o all_records.jsonl --recursive
     """
-    from srdedupe import parse_file, parse_folder, write_jsonl
+    from srdedupe import parse_file, parse_folder_iter, write_jsonl
 
     input_path_obj = Path(input_path)
 
@@ -74,6 +109,7 @@ def parse(
         click.echo(f"Processing: {input_path}", err=True)
 
     try:
+        records: Iterable[CanonicalRecord]
         if input_path_obj.is_file():
             if verbose:
                 click.echo(f"Parsing file: {input_path_obj.name}", err=True)
@@ -81,7 +117,9 @@ def parse(
         elif input_path_obj.is_dir():
             if verbose:
                 click.echo(f"Parsing folder: {input_path} (recursive={recursive})", err=True)
-            records = parse_folder(input_path_obj, recursive=recursive)
+            # Folders are streamed file by file into the writer, so only one
+            # file's records are held in memory at a time.
+            records = parse_folder_iter(input_path_obj, recursive=recursive)
         else:
             click.secho(
                 f"Error: {input_path} is neither a file nor a directory",
@@ -91,12 +129,11 @@ def parse(
             sys.exit(1)
 
         if verbose:
-            click.echo(f"Found {len(records)} records", err=True)
             click.echo(f"Writing to: {output}", err=True)
 
-        write_jsonl(records, output)
+        count = write_jsonl(records, output)
 
-        click.secho(f"✓ Successfully wrote {len(records)} records to {output}", fg="green")
+        click.secho(f"✓ Successfully wrote {count} records to {output}", fg="green")
 
     except Exception as e:
         click.secho(f"Error: {e}", fg="red", err=True)
@@ -238,5 +275,38 @@ def deduplicate(
         sys.exit(1)
 
 
+@cli.group()
+def audit() -> None:
+    """Inspect run manifests and audit logs."""
+
+
+@audit.command("show")
+@click.argument("path", type=click.Path(exists=True))
+def audit_show(path: str) -> None:
+    """Pretty-print the run manifest at PATH.
+
+    PATH can be a run.json file or a run output directory containing one.
+
+    Examples
+    --------
+        srdedupe audit show out/
+        srdedupe audit show out/run.json
+    """
+    import json
+
+    manifest_path = Path(path)
+    if manifest_path.is_dir():
+        manifest_path = manifest_path / "run.json"
+
+    try:
+        with manifest_path.open(encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        click.secho(f"Error: {e}", fg="red", err=True)
+        sys.exit(1)
+
+    click.echo(json.dumps(manifest, indent=2, ensure_ascii=False))
+
+
 if __name__ == "__main__":
     cli()
@@ -1,8 +1,8 @@
 """Clustering and global consistency checks for duplicate detection.
 
 This module transforms pairwise AUTO-DUP decisions into duplicate clusters
-using Union-Find (DSU), with global consistency checks to prevent transitive
-closure errors.
+via connected components, with global consistency checks to prevent
+transitive closure errors.
 """
 
 from srdedupe.clustering.cluster_builder import build_clusters
@@ -4,6 +4,8 @@ import json
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 from srdedupe.clustering.consistency import (
     check_cluster_consistency,
     split_cluster_by_id,
@@ -18,9 +20,15 @@ from srdedupe.clustering.models import (
     Edge,
     compute_cluster_id,
 )
-from srdedupe.clustering.union_find import UnionFind
 from srdedupe.models import CanonicalRecord
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_AUTO_MARKER = b'"AUTO_'
+
 
 def build_clusters(
     pair_decisions_path: Path,
@@ -71,6 +79,8 @@ def _load_decisions(
 
     Parses all decisions once, returning typed AUTO_DUP edges and a
     pre-built AUTO_KEEP adjacency index for O(1) contradiction lookups.
+    Lines are read as bytes and decoded with ``orjson`` when installed,
+    falling back to the stdlib ``json`` module.
 
     Parameters
     ----------
@@ -84,14 +94,23 @@ def _load_decisions(
     """
     auto_dup_edges: list[Edge] = []
     auto_keep_index: dict[str, set[str]] = defaultdict(set)
+    loads = orjson.loads if orjson is not None else json.loads
+    add_edge = auto_dup_edges.append
+    edge_from_dict = Edge.from_dict
+    # Scoped to this load, so the interned tuples go away with its edges
+    reason_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
 
-    with pair_decisions_path.open("r") as f:
+    with pair_decisions_path.open("rb") as f:
         for line in f:
-            data = json.loads(line)
+            # Neither decision we keep can be spelled without this literal,
+            # so REVIEW lines are skipped without being decoded.
+            if _AUTO_MARKER not in line:
+                continue
+            data = loads(line)
             decision = data["decision"]
 
             if decision == "AUTO_DUP":
-                auto_dup_edges.append(Edge.from_dict(data))
+                add_edge(edge_from_dict(data, reason_tuples))
             elif decision == "AUTO_KEEP":
                 rid_a = data["rid_a"]
                 rid_b = data["rid_b"]
@@ -106,6 +125,11 @@ def _compute_component_edges(
 ) -> list[tuple[tuple[str, ...], list[Edge]]]:
     """Compute connected components with their edges in a single pass.
 
+    Edges are viewed as parallel arrays of endpoint ids (rids interned to
+    ints) and labelled in NumPy by ``_component_labels``. Nodes and edges
+    are then grouped by component label with one stable argsort each, so
+    every component's edges keep their input order.
+
     Parameters
     ----------
     edges : list[Edge]
@@ -116,23 +140,59 @@ def _compute_component_edges(
     list[tuple[tuple[str, ...], list[Edge]]]
         Each entry is (sorted rids tuple, edges for that component).
     """
-    uf = UnionFind()
-    for edge in edges:
-        uf.union(edge.rid_a, edge.rid_b)
+    if not edges:
+        return []
 
-    # Group edges by their component root in one pass over edges
-    root_edges: dict[str, list[Edge]] = defaultdict(list)
+    rid_ids: dict[str, int] = {}
     for edge in edges:
-        root = uf.find(edge.rid_a)
-        root_edges[root].append(edge)
+        rid_ids.setdefault(edge.rid_a, len(rid_ids))
+        rid_ids.setdefault(edge.rid_b, len(rid_ids))
+    rids = list(rid_ids)
+    rid_a_idx = np.fromiter((rid_ids[e.rid_a] for e in edges), dtype=np.int64, count=len(edges))
+    rid_b_idx = np.fromiter((rid_ids[e.rid_b] for e in edges), dtype=np.int64, count=len(edges))
 
-    result: list[tuple[tuple[str, ...], list[Edge]]] = []
-    for component_rids in uf.get_components():
-        sorted_rids = tuple(sorted(component_rids))
-        root = uf.find(sorted_rids[0])
-        result.append((sorted_rids, root_edges.get(root, [])))
+    labels = _component_labels(rid_a_idx, rid_b_idx, len(rids))
 
-    return result
+    node_groups = _group_by_label(labels)
+    edge_groups = _group_by_label(labels[rid_a_idx])
+
+    return [
+        (tuple(sorted(rids[i] for i in nodes)), [edges[i] for i in edge_ids])
+        for nodes, edge_ids in zip(node_groups, edge_groups, strict=True)
+    ]
+
+
+def _component_labels(rid_a_idx: np.ndarray, rid_b_idx: np.ndarray, n_nodes: int) -> np.ndarray:
+    """Label each node with the smallest node id in its component.
+
+    Vectorised hook-and-jump connected components: every round hooks the
+    root of each edge's larger-labelled endpoint onto the smaller label,
+    then compresses every node straight to its root by pointer jumping.
+    Labels only decrease and a label never exceeds its node id, so the
+    forest stays acyclic; rounds stop once every edge joins equal labels,
+    which takes O(log n) rounds in practice.
+    """
+    labels = np.arange(n_nodes, dtype=np.int64)
+    while True:
+        root_a = labels[rid_a_idx]
+        root_b = labels[rid_b_idx]
+        if np.array_equal(root_a, root_b):
+            return labels
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(labels, root_a, low)
+        np.minimum.at(labels, root_b, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def _group_by_label(labels: np.ndarray) -> list[list[int]]:
+    """Group positions by label, in label order, keeping positions ascending."""
+    order = np.argsort(labels, kind="stable")
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    return [group.tolist() for group in np.split(order, bounds)]
 
 
 def _process_component(
@@ -162,10 +222,17 @@ def _process_component(
     list[Cluster]
         One or more clusters (if split).
     """
+    # Edge strength feeds both the weak-bridge check and cluster support;
+    # it is computed once here and carried alongside the edges.
+    strong = [
+        edge.is_strong(config.strong_edge_t_strong, config.strong_edge_use_reason_codes)
+        for edge in cluster_edges
+    ]
     consistency = check_cluster_consistency(
         rids,
         records_map,
         cluster_edges,
+        strong,
         auto_keep_index,
         config,
     )
@@ -180,18 +247,20 @@ def _process_component(
             rids,
             records_map,
             cluster_edges,
+            strong,
             auto_keep_index,
             config,
             consistency,
         )
 
-    return [_create_cluster(rids, cluster_edges, consistency, config)]
+    return [_create_cluster(rids, cluster_edges, strong, consistency)]
 
 
 def _split_and_create_clusters(
     rids: tuple[str, ...],
     records_map: dict[str, CanonicalRecord],
     cluster_edges: list[Edge],
+    strong: list[bool],
     auto_keep_index: dict[str, set[str]],
     config: ClusteringConfig,
     original_consistency: ClusterConsistency,
@@ -206,6 +275,8 @@ def _split_and_create_clusters(
         Mapping from rid to record.
     cluster_edges : list[Edge]
         AUTO-DUP edges.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
     auto_keep_index : dict[str, set[str]]
         AUTO_KEEP adjacency index.
     config : ClusteringConfig
@@ -226,19 +297,31 @@ def _split_and_create_clusters(
 
     subclusters_rids = split_cluster_by_id(rids, records_map, conflict_type)
 
-    clusters: list[Cluster] = []
-    for sub_rids in subclusters_rids:
-        rid_set = frozenset(sub_rids)
-        sub_edges = [e for e in cluster_edges if e.involves(rid_set)]
+    # Route each edge to the subcluster holding both endpoints in one pass,
+    # rather than rescanning every edge once per subcluster.
+    subcluster_of = {rid: i for i, sub_rids in enumerate(subclusters_rids) for rid in sub_rids}
+    subclusters_edges: list[list[Edge]] = [[] for _ in subclusters_rids]
+    subclusters_strong: list[list[bool]] = [[] for _ in subclusters_rids]
+    for edge, is_strong in zip(cluster_edges, strong, strict=True):
+        sub_index = subcluster_of.get(edge.rid_a)
+        if sub_index is not None and sub_index == subcluster_of.get(edge.rid_b):
+            subclusters_edges[sub_index].append(edge)
+            subclusters_strong[sub_index].append(is_strong)
 
+    clusters: list[Cluster] = []
+    for sub_rids, sub_edges, sub_strong in zip(
+        subclusters_rids, subclusters_edges, subclusters_strong, strict=True
+    ):
         consistency = check_cluster_consistency(
             sub_rids,
             records_map,
             sub_edges,
+            sub_strong,
             auto_keep_index,
             config,
+            split_by=conflict_type,
         )
-        clusters.append(_create_cluster(sub_rids, sub_edges, consistency, config))
+        clusters.append(_create_cluster(sub_rids, sub_edges, sub_strong, consistency))
 
     return clusters
 
@@ -246,8 +329,8 @@ def _split_and_create_clusters(
 def _create_cluster(
     rids: tuple[str, ...],
     cluster_edges: list[Edge],
+    strong: list[bool],
     consistency: ClusterConsistency,
-    config: ClusteringConfig,
 ) -> Cluster:
     """Create a cluster object.
 
@@ -257,10 +340,10 @@ def _create_cluster(
         Sorted record IDs in cluster.
     cluster_edges : list[Edge]
         AUTO-DUP edges in cluster.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
     consistency : ClusterConsistency
         Consistency check results.
-    config : ClusteringConfig
-        Clustering configuration.
 
     Returns
     -------
@@ -268,7 +351,7 @@ def _create_cluster(
         Cluster object.
     """
     cluster_id = compute_cluster_id(rids)
-    support = _compute_support(cluster_edges, config)
+    support = _compute_support(cluster_edges, strong)
     status = (
         ClusterStatus.REVIEW
         if consistency.hard_conflicts or consistency.soft_conflicts
@@ -286,7 +369,7 @@ def _create_cluster(
 
 def _compute_support(
     cluster_edges: list[Edge],
-    config: ClusteringConfig,
+    strong: list[bool],
 ) -> ClusterSupport:
     """Compute support metadata for cluster.
 
@@ -294,27 +377,25 @@ def _compute_support(
     ----------
     cluster_edges : list[Edge]
         AUTO-DUP edges in cluster.
-    config : ClusteringConfig
-        Clustering configuration.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
 
     Returns
     -------
     ClusterSupport
         Support metadata.
     """
-    strong_count = 0
-    source_counts: dict[str, int] = defaultdict(int)
+    # A plain dict is returned as-is; most clusters have a handful of edges,
+    # where a defaultdict plus the final copy cost more than the counting.
+    source_counts: dict[str, int] = {}
 
     for edge in cluster_edges:
-        if edge.is_strong(config.strong_edge_t_strong, config.strong_edge_use_reason_codes):
-            strong_count += 1
-
         for code in edge.reasons:
             if code:
-                source_counts[code] += 1
+                source_counts[code] = source_counts.get(code, 0) + 1
 
     return ClusterSupport(
         edges_auto_dup=len(cluster_edges),
-        strong_edge_count=strong_count,
-        sources=dict(source_counts),
+        strong_edge_count=sum(strong),
+        sources=source_counts,
     )
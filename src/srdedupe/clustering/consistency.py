@@ -1,6 +1,7 @@
 """Consistency checks for clusters to prevent transitive closure errors."""
 
 from collections import defaultdict
+from dataclasses import dataclass, field
 
 from srdedupe.clustering.models import (
     ClusterConsistency,
@@ -15,8 +16,11 @@ def check_cluster_consistency(
     rids: tuple[str, ...],
     records_map: dict[str, CanonicalRecord],
     cluster_edges: list[Edge],
+    strong: list[bool],
     auto_keep_index: dict[str, set[str]],
     config: ClusteringConfig,
+    *,
+    split_by: ConflictType | None = None,
 ) -> ClusterConsistency:
     """Check cluster for hard and soft consistency conflicts.
 
@@ -28,18 +32,25 @@ def check_cluster_consistency(
         Mapping from rid to canonical record.
     cluster_edges : list[Edge]
         AUTO-DUP edges in this cluster.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
     auto_keep_index : dict[str, set[str]]
         Pre-built index: rid -> set of rids it has AUTO_KEEP with.
     config : ClusteringConfig
         Clustering configuration.
+    split_by : ConflictType | None, optional
+        Identifier conflict the cluster was split on, if it is a
+        subcluster of a split. Each subcluster holds at most one value of
+        that identifier, so it is not scanned again. By default None.
 
     Returns
     -------
     ClusterConsistency
         Immutable consistency check results.
     """
-    hard = _collect_hard_conflicts(rids, records_map, auto_keep_index)
-    soft = _collect_soft_conflicts(rids, records_map, cluster_edges, config)
+    summary = _summarize_records(rids, records_map, split_by)
+    hard = _collect_hard_conflicts(rids, summary, auto_keep_index)
+    soft = _collect_soft_conflicts(rids, summary, cluster_edges, strong, config)
     notes = _collect_notes(rids, config)
 
     return ClusterConsistency(
@@ -49,12 +60,25 @@ def check_cluster_consistency(
     )
 
 
-def _collect_hard_conflicts(
+@dataclass(slots=True)
+class _RecordSummary:
+    """Record fields the hard and soft checks need, gathered in one pass."""
+
+    doi_values: set[str] = field(default_factory=set)
+    pmid_values: set[str] = field(default_factory=set)
+    has_special_record: bool = False
+    year_count: int = 0
+    year_min: int = 0
+    year_max: int = 0
+    title_keys: set[str] = field(default_factory=set)
+
+
+def _summarize_records(
     rids: tuple[str, ...],
     records_map: dict[str, CanonicalRecord],
-    auto_keep_index: dict[str, set[str]],
-) -> list[str]:
-    """Collect hard conflicts that block AUTO status.
+    split_by: ConflictType | None = None,
+) -> _RecordSummary:
+    """Walk the cluster's records once, collecting every field checked.
 
     Parameters
     ----------
@@ -62,45 +86,99 @@ def _collect_hard_conflicts(
         Record IDs in cluster.
     records_map : dict[str, CanonicalRecord]
         Mapping from rid to canonical record.
-    auto_keep_index : dict[str, set[str]]
-        Pre-built AUTO_KEEP adjacency index.
+    split_by : ConflictType | None, optional
+        Identifier conflict the cluster was split on; that identifier is
+        skipped. By default None.
 
     Returns
     -------
-    list[str]
-        List of hard conflict type values.
+    _RecordSummary
+        Identifier values, special-record flag, year bounds and title keys.
     """
-    conflicts: list[str] = []
-    doi_values: set[str] = set()
-    pmid_values: set[str] = set()
+    summary = _RecordSummary()
+    doi_values = summary.doi_values
+    pmid_values = summary.pmid_values
+    title_keys = summary.title_keys
     has_special_record = False
+    year_count = 0
+    year_min = year_max = 0
+    check_doi = split_by is not ConflictType.DOI_CONFLICT
+    check_pmid = split_by is not ConflictType.PMID_CONFLICT
 
     for rid in rids:
         record = records_map.get(rid)
         if not record:
             continue
 
-        if record.canon.doi_norm:
-            doi_values.add(record.canon.doi_norm)
+        canon = record.canon
+        if check_doi and canon.doi_norm:
+            doi_values.add(canon.doi_norm)
 
-        if record.canon.pmid_norm:
-            pmid_values.add(record.canon.pmid_norm)
+        if check_pmid and canon.pmid_norm:
+            pmid_values.add(canon.pmid_norm)
 
-        if (
-            record.flags.is_erratum_notice
-            or record.flags.is_retraction_notice
-            or record.flags.is_corrected_republished
-            or record.flags.has_linked_citation
+        flags = record.flags
+        if not has_special_record and (
+            flags.is_erratum_notice
+            or flags.is_retraction_notice
+            or flags.is_corrected_republished
+            or flags.has_linked_citation
         ):
             has_special_record = True
 
-    if len(doi_values) >= 2:
+        # Year bounds are tracked as we go, so no list of years is built
+        # and scanned twice afterwards.
+        year = canon.year_norm
+        if year:
+            if not year_count:
+                year_min = year_max = year
+            elif year < year_min:
+                year_min = year
+            elif year > year_max:
+                year_max = year
+            year_count += 1
+
+        title_key = record.keys.title_key_strict
+        if title_key:
+            title_keys.add(title_key)
+
+    summary.has_special_record = has_special_record
+    summary.year_count = year_count
+    summary.year_min = year_min
+    summary.year_max = year_max
+    return summary
+
+
+def _collect_hard_conflicts(
+    rids: tuple[str, ...],
+    summary: _RecordSummary,
+    auto_keep_index: dict[str, set[str]],
+) -> list[str]:
+    """Collect hard conflicts that block AUTO status.
+
+    Parameters
+    ----------
+    rids : tuple[str, ...]
+        Record IDs in cluster.
+    summary : _RecordSummary
+        Fields gathered from the cluster's records.
+    auto_keep_index : dict[str, set[str]]
+        Pre-built AUTO_KEEP adjacency index.
+
+    Returns
+    -------
+    list[str]
+        List of hard conflict type values.
+    """
+    conflicts: list[str] = []
+
+    if len(summary.doi_values) >= 2:
         conflicts.append(ConflictType.DOI_CONFLICT.value)
 
-    if len(pmid_values) >= 2:
+    if len(summary.pmid_values) >= 2:
         conflicts.append(ConflictType.PMID_CONFLICT.value)
 
-    if has_special_record:
+    if summary.has_special_record:
         conflicts.append(ConflictType.LINKED_CITATION_RISK.value)
 
     if _has_internal_auto_keep(rids, auto_keep_index):
@@ -127,18 +205,24 @@ def _has_internal_auto_keep(
     bool
         True if contradiction exists.
     """
-    rid_set = frozenset(rids)
+    # Most clusters have no AUTO_KEEP partners at all, so the rid set is
+    # only built once a rid with partners turns up.
+    rid_set: frozenset[str] | None = None
     for rid in rids:
-        partners = auto_keep_index.get(rid, set())
-        if partners & rid_set:
-            return True
+        partners = auto_keep_index.get(rid)
+        if partners:
+            if rid_set is None:
+                rid_set = frozenset(rids)
+            if not partners.isdisjoint(rid_set):
+                return True
     return False
 
 
 def _collect_soft_conflicts(
     rids: tuple[str, ...],
-    records_map: dict[str, CanonicalRecord],
+    summary: _RecordSummary,
     cluster_edges: list[Edge],
+    strong: list[bool],
     config: ClusteringConfig,
 ) -> list[str]:
     """Collect soft conflicts that suggest caution.
@@ -147,10 +231,12 @@ def _collect_soft_conflicts(
     ----------
     rids : tuple[str, ...]
         Record IDs in cluster.
-    records_map : dict[str, CanonicalRecord]
-        Mapping from rid to canonical record.
+    summary : _RecordSummary
+        Fields gathered from the cluster's records.
     cluster_edges : list[Edge]
         AUTO-DUP edges in cluster.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
     config : ClusteringConfig
         Clustering configuration.
 
@@ -160,29 +246,17 @@ def _collect_soft_conflicts(
         List of soft conflict type values.
     """
     conflicts: list[str] = []
-    years: list[int] = []
-    title_keys: set[str] = set()
 
-    for rid in rids:
-        record = records_map.get(rid)
-        if not record:
-            continue
+    if (
+        summary.year_count >= 2
+        and summary.year_max - summary.year_min > config.soft_conflicts_year_max_spread
+    ):
+        conflicts.append(ConflictType.YEAR_FAR.value)
 
-        if record.canon.year_norm:
-            years.append(record.canon.year_norm)
-
-        if record.keys.title_key_strict:
-            title_keys.add(record.keys.title_key_strict)
-
-    if len(years) >= 2:
-        year_spread = max(years) - min(years)
-        if year_spread > config.soft_conflicts_year_max_spread:
-            conflicts.append(ConflictType.YEAR_FAR.value)
-
-    if len(title_keys) > config.soft_conflicts_title_divergence_tolerance + 1:
+    if len(summary.title_keys) > config.soft_conflicts_title_divergence_tolerance + 1:
         conflicts.append(ConflictType.TITLE_KEY_DIVERGENT.value)
 
-    if _is_bridged_by_weak_edges(rids, cluster_edges, config):
+    if _is_bridged_by_weak_edges(rids, cluster_edges, strong):
         conflicts.append(ConflictType.BRIDGED_BY_WEAK_EDGES.value)
 
     return conflicts
@@ -191,7 +265,7 @@ def _collect_soft_conflicts(
 def _is_bridged_by_weak_edges(
     rids: tuple[str, ...],
     cluster_edges: list[Edge],
-    config: ClusteringConfig,
+    strong: list[bool],
 ) -> bool:
     """Check if cluster is bridged by weak edges.
 
@@ -204,8 +278,8 @@ def _is_bridged_by_weak_edges(
         Record IDs in cluster.
     cluster_edges : list[Edge]
         AUTO-DUP edges in cluster.
-    config : ClusteringConfig
-        Clustering configuration.
+    strong : list[bool]
+        Whether each edge in *cluster_edges* is strong.
 
     Returns
     -------
@@ -215,31 +289,19 @@ def _is_bridged_by_weak_edges(
     if len(rids) < 3:
         return False
 
-    has_any_strong = any(
-        e.is_strong(config.strong_edge_t_strong, config.strong_edge_use_reason_codes)
-        for e in cluster_edges
-    )
-    if not has_any_strong:
+    if not any(strong):
         return True
 
+    # One pass records each node's degree and whether its first incident
+    # edge is strong; a degree-1 node's first incident edge is its only one.
     degree_map: dict[str, int] = defaultdict(int)
-    for edge in cluster_edges:
-        degree_map[edge.rid_a] += 1
-        degree_map[edge.rid_b] += 1
+    first_incident_strong: dict[str, bool] = {}
+    for edge, is_strong in zip(cluster_edges, strong, strict=True):
+        for rid in (edge.rid_a, edge.rid_b):
+            degree_map[rid] += 1
+            first_incident_strong.setdefault(rid, is_strong)
 
-    for rid in rids:
-        if degree_map[rid] != 1:
-            continue
-        incident = next(
-            (e for e in cluster_edges if e.rid_a == rid or e.rid_b == rid),
-            None,
-        )
-        if incident and not incident.is_strong(
-            config.strong_edge_t_strong, config.strong_edge_use_reason_codes
-        ):
-            return True
-
-    return False
+    return any(degree_map[rid] == 1 and not first_incident_strong[rid] for rid in rids)
 
 
 def _collect_notes(
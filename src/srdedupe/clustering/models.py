@@ -1,9 +1,11 @@
 """Data models for clustering and consistency checks."""
 
 import hashlib
+import sys
 from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import StrEnum
+from operator import itemgetter
 from typing import Any
 
 
@@ -54,8 +56,11 @@ class ConflictType(StrEnum):
 
 STRONG_REASON_CODES: frozenset[str] = frozenset({"doi_exact", "pmid_exact"})
 
+# Required decision keys, fetched in one call per loaded edge.
+_EDGE_KEYS = itemgetter("pair_id", "rid_a", "rid_b", "decision")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Edge:
     """A pairwise decision edge.
 
@@ -83,28 +88,41 @@ class Edge:
     reasons: tuple[str, ...]
 
     @staticmethod
-    def from_dict(data: dict[str, Any]) -> "Edge":
+    def from_dict(
+        data: dict[str, Any],
+        reason_tuples: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+    ) -> "Edge":
         """Create Edge from raw decision dict.
 
         Parameters
         ----------
         data : dict[str, Any]
             Raw decision dictionary from JSONL.
+        reason_tuples : dict[tuple[str, ...], tuple[str, ...]] | None, optional
+            Canonical reason-code tuples shared by the edges of one load.
+            Decisions draw on a handful of codes, so passing the same dict
+            for every edge makes them share one interned tuple per distinct
+            combination instead of each holding freshly decoded strings.
 
         Returns
         -------
         Edge
             Typed edge.
         """
-        raw_reasons = data.get("reasons", [])
+        pair_id, rid_a, rid_b, decision = _EDGE_KEYS(data)
         reason_codes = tuple(
-            r.get("code", "") if isinstance(r, dict) else str(r) for r in raw_reasons
+            [r.get("code", "") if isinstance(r, dict) else str(r) for r in data.get("reasons", ())]
         )
+        if reason_tuples is not None:
+            shared = reason_tuples.get(reason_codes)
+            if shared is None:
+                shared = reason_tuples[reason_codes] = tuple(map(sys.intern, reason_codes))
+            reason_codes = shared
         return Edge(
-            pair_id=data["pair_id"],
-            rid_a=data["rid_a"],
-            rid_b=data["rid_b"],
-            decision=data["decision"],
+            pair_id=pair_id,
+            rid_a=rid_a,
+            rid_b=rid_b,
+            decision=decision,
             p_match=data.get("p_match", 0.0),
             reasons=reason_codes,
         )
@@ -124,8 +142,12 @@ class Edge:
         bool
             True if edge is strong.
         """
-        if use_reason_codes and STRONG_REASON_CODES.intersection(self.reasons):
-            return True
+        if use_reason_codes:
+            # Edges carry one to three reasons, so direct frozenset lookups
+            # beat a set-method call on the tuple.
+            for reason in self.reasons:
+                if reason in STRONG_REASON_CODES:
+                    return True
         return self.p_match >= threshold
 
     def involves(self, rid_set: frozenset[str]) -> bool:
@@ -144,7 +166,7 @@ class Edge:
         return self.rid_a in rid_set and self.rid_b in rid_set
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterSupport:
     """Support metadata for cluster.
 
@@ -177,7 +199,7 @@ class ClusterSupport:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterConsistency:
     """Consistency check results for cluster.
 
@@ -210,7 +232,7 @@ class ClusterConsistency:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cluster:
     """Duplicate cluster with metadata.
 
@@ -277,7 +299,7 @@ class Cluster:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusteringConfig:
     """Configuration for clustering and consistency checks.
 
@@ -12,12 +12,19 @@ References
 
 import math
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
+
 from srdedupe.decision.models import CalibrationPair, ConfusionMatrix
 
+# Field getters for loading pairs into arrays without a generator frame.
+_SCORE = attrgetter("score")
+_IS_DUPLICATE = attrgetter("is_duplicate")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConformalCalibration:
     """Conformal calibration results.
 
@@ -123,58 +130,37 @@ def calibrate_conformal_threshold(
         raise ValueError(f"delta must be in (0, 1), got {delta}")
 
     n = len(calibration_pairs)
-    total_positives = sum(1 for p in calibration_pairs if p.is_duplicate)
-    total_negatives = n - total_positives
+    scores = np.fromiter(map(_SCORE, calibration_pairs), dtype=np.float64, count=n)
+    labels = np.fromiter(map(_IS_DUPLICATE, calibration_pairs), dtype=np.bool_, count=n)
 
     # DKW half-width: eps(n, delta) = sqrt((1/(2n)) * log(2/delta))
     eps = math.sqrt((1 / (2 * n)) * math.log(2 / delta))
 
-    # Sort descending by score
-    sorted_pairs = sorted(calibration_pairs, key=lambda p: p.score, reverse=True)
-
-    # Extract unique thresholds, sorted descending
-    unique_scores = sorted({p.score for p in calibration_pairs}, reverse=True)
-
-    # O(n) sweep: running counters for accepted pairs
-    best_threshold = float("inf")
-    best_xi_hat = 0.0
-    best_xi_lcb = 0.0
-    best_tp = 0
-    best_fp = 0
-    feasible_found = False
-
-    running_tp = 0
-    running_fp = 0
-    pair_idx = 0
-
-    for threshold in unique_scores:
-        # Advance pointer to include all pairs with score >= threshold
-        while pair_idx < n and sorted_pairs[pair_idx].score >= threshold:
-            if sorted_pairs[pair_idx].is_duplicate:
-                running_tp += 1
-            else:
-                running_fp += 1
-            pair_idx += 1
-
-        n_accepted = running_tp + running_fp
-        xi_hat = n_accepted / n
-        xi_lcb = max(xi_hat - eps, 0.0)
-
-        # Feasibility: (n+1) * alpha * xi_lcb >= 1
-        if (n + 1) * alpha * xi_lcb < 1.0:
-            continue
-
-        # Conformal-safe condition: FP <= ceil((n+1) * alpha * xi_lcb) - 1
-        conformal_bound = math.ceil((n + 1) * alpha * xi_lcb) - 1
-
-        if running_fp <= conformal_bound:
-            best_threshold = threshold
-            best_xi_hat = xi_hat
-            best_xi_lcb = xi_lcb
-            best_tp = running_tp
-            best_fp = running_fp
-            feasible_found = True
-            # Continue to find smallest safe threshold (most permissive)
+    # Sort descending by score once; cumulative counts give TP/FP for
+    # accepting the first i+1 pairs. Only counts at the end of a run of tied
+    # scores are read, and those do not depend on the order within the run,
+    # so an unstable sort is enough.
+    order = np.argsort(-scores)
+    sorted_scores = scores[order]
+    tp_cum = np.cumsum(labels[order])
+    fp_cum = np.arange(1, n + 1) - tp_cum
+    total_positives = int(tp_cum[-1])
+    total_negatives = n - total_positives
+
+    # Each unique threshold accepts every pair up to the last one sharing
+    # its score, so only those tie-block ends are evaluated.
+    ends = np.append(np.flatnonzero(sorted_scores[1:] != sorted_scores[:-1]), n - 1)
+    n_thresholds = len(ends)
+
+    xi_hat_all = (ends + 1) / n
+    xi_lcb_all = np.maximum(xi_hat_all - eps, 0.0)
+    budget = (n + 1) * alpha * xi_lcb_all
+
+    # Feasibility: (n+1) * alpha * xi_lcb >= 1
+    # Conformal-safe condition: FP <= ceil((n+1) * alpha * xi_lcb) - 1
+    safe = (budget >= 1.0) & (fp_cum[ends] <= np.ceil(budget) - 1)
+    safe_idx = np.flatnonzero(safe)
+    feasible_found = len(safe_idx) > 0
 
     if not feasible_found:
         cm = ConfusionMatrix(tp=0, fp=0, tn=total_negatives, fn=total_positives)
@@ -188,10 +174,16 @@ def calibrate_conformal_threshold(
             xi_hat=0.0,
             xi_lcb=0.0,
             feasible=False,
-            n_thresholds_checked=len(unique_scores),
+            n_thresholds_checked=n_thresholds,
             confusion_matrix=cm,
         )
 
+    # The smallest safe threshold (most permissive) is the last one swept.
+    best = int(safe_idx[-1])
+    end = int(ends[best])
+    best_tp = int(tp_cum[end])
+    best_fp = int(fp_cum[end])
+
     cm = ConfusionMatrix(
         tp=best_tp,
         fp=best_fp,
@@ -204,10 +196,10 @@ def calibrate_conformal_threshold(
         delta=delta,
         n_calib=n,
         score_field=score_field,
-        t_high_conformal=best_threshold,
-        xi_hat=best_xi_hat,
-        xi_lcb=best_xi_lcb,
-        feasible=feasible_found,
-        n_thresholds_checked=len(unique_scores),
+        t_high_conformal=float(sorted_scores[end]),
+        xi_hat=float(xi_hat_all[best]),
+        xi_lcb=float(xi_lcb_all[best]),
+        feasible=True,
+        n_thresholds_checked=n_thresholds,
         confusion_matrix=cm,
     )
@@ -116,7 +116,7 @@ def categorize_forced_reason(reason: ReasonCode) -> str | None:
     return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfusionMatrix:
     """Confusion matrix for calibration evaluation.
 
@@ -148,7 +148,7 @@ class ConfusionMatrix:
         return {"tp": self.tp, "fp": self.fp, "tn": self.tn, "fn": self.fn}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Thresholds:
     """Decision thresholds.
 
@@ -185,7 +185,7 @@ class Thresholds:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NPCalibration:
     """Neyman-Pearson calibration metadata.
 
@@ -230,7 +230,7 @@ class NPCalibration:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationPair:
     """Calibration pair with ground truth.
 
@@ -249,7 +249,7 @@ class CalibrationPair:
     is_duplicate: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PairDecision:
     """Decision result for a single pair.
 
@@ -312,7 +312,7 @@ class PairDecision:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecisionSummary:
     """Summary statistics for decision stage.
 
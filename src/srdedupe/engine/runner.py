@@ -22,6 +22,7 @@ from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+from srdedupe.api import write_jsonl
 from srdedupe.audit.logger import AuditLogger
 from srdedupe.candidates.blockers import Blocker
 from srdedupe.candidates.factory import BlockerConfig, create_blockers
@@ -179,11 +180,7 @@ def _stage1_parse_and_normalize(
 
     normalized_records = [normalize(rec) for rec in records]
 
-    output_path = output_dir / "canonical_records.jsonl"
-    with output_path.open("w", encoding="utf-8") as f:
-        for record in normalized_records:
-            json.dump(record.to_dict(), f, ensure_ascii=False, sort_keys=True)
-            f.write("\n")
+    write_jsonl(normalized_records, output_dir / "canonical_records.jsonl")
 
     if logger:
         logger.event(
@@ -50,16 +50,15 @@ def calculate_file_sha256(path: Path) -> str:
 
     Notes
     -----
-    This function reads files in chunks for memory efficiency.
-    Use this when you have a file path.
+    This function streams the file through ``hashlib.file_digest``, which
+    reads into a reusable buffer and hashes large chunks with the GIL
+    released. Use this when you have a file path.
     """
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    sha256_hash = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
+        sha256_hash = hashlib.file_digest(f, "sha256")
 
     return format_sha256(sha256_hash.hexdigest())
 
@@ -1,6 +1,9 @@
 """Tests for the public API module."""
 
+import ast
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -10,6 +13,7 @@ from srdedupe import (
     ParseError,
     parse_file,
     parse_folder,
+    parse_folder_iter,
     write_jsonl,
 )
 
@@ -26,6 +30,51 @@ def sample_ris_file(fixtures_dir: Path) -> Path:
     return fixtures_dir / "sample.ris"
 
 
+# ---------------------------------------------------------------------------
+# package import
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_import_srdedupe_is_lazy() -> None:
+    """Test importing the package does not eagerly import the API modules."""
+    code = "import sys, srdedupe; print(sorted(m for m in sys.modules if m.startswith('srdedupe')))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    loaded = ast.literal_eval(result.stdout.strip())
+
+    assert "srdedupe.api" not in loaded
+    assert not any(m.startswith(("srdedupe.parse", "srdedupe.engine")) for m in loaded)
+
+
+@pytest.mark.unit
+def test_lazy_attribute_access() -> None:
+    """Test public names resolve on access and unknown names raise."""
+    import srdedupe
+
+    assert srdedupe.parse_file is parse_file
+    assert "write_jsonl" in dir(srdedupe)
+    assert "importlib" not in dir(srdedupe)
+    with pytest.raises(AttributeError):
+        _ = srdedupe.not_a_public_name  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_normalize_export_survives_submodule_import() -> None:
+    """Test the exported normalize function is not shadowed by its subpackage."""
+    code = (
+        "import srdedupe.engine.runner, srdedupe; "
+        "from srdedupe import normalize; "
+        "print(callable(srdedupe.normalize), callable(normalize))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "True True"
+
+
 # ---------------------------------------------------------------------------
 # parse_file
 # ---------------------------------------------------------------------------
@@ -151,6 +200,37 @@ def test_parse_folder_recursive(fixtures_dir: Path) -> None:
     assert len(records_recursive) >= len(records_non_recursive)
 
 
+@pytest.mark.unit
+def test_parse_folder_iter_matches_parse_folder(fixtures_dir: Path) -> None:
+    """Test parse_folder_iter lazily yields the same records as parse_folder."""
+    records_iter = parse_folder_iter(fixtures_dir)
+
+    assert not isinstance(records_iter, list)
+    assert [r.rid for r in records_iter] == [r.rid for r in parse_folder(fixtures_dir)]
+
+
+@pytest.mark.unit
+def test_parse_folder_iter_nonexistent_raises_eagerly() -> None:
+    """Test parse_folder_iter validates the folder before iteration starts."""
+    with pytest.raises(FileNotFoundError):
+        parse_folder_iter("/nonexistent/folder/")
+
+
+@pytest.mark.unit
+def test_write_jsonl_accepts_iterator(fixtures_dir: Path, tmp_path: Path) -> None:
+    """Test write_jsonl streams records from parse_folder_iter."""
+    streamed_file = tmp_path / "streamed.jsonl"
+    list_file = tmp_path / "list.jsonl"
+
+    streamed_count = write_jsonl(parse_folder_iter(fixtures_dir), streamed_file)
+    write_jsonl(parse_folder(fixtures_dir), list_file)
+
+    streamed = [json.loads(line)["rid"] for line in streamed_file.read_text().splitlines()]
+    listed = [json.loads(line)["rid"] for line in list_file.read_text().splitlines()]
+    assert streamed == listed
+    assert streamed_count == len(streamed)
+
+
 # ---------------------------------------------------------------------------
 # write_jsonl
 # ---------------------------------------------------------------------------
@@ -189,6 +269,46 @@ def test_write_jsonl_deterministic(sample_ris_file: Path, tmp_path: Path) -> Non
     assert output_file1.read_bytes() == output_file2.read_bytes()
 
 
+@pytest.mark.unit
+def test_write_jsonl_stdlib_fallback_matches_orjson(
+    sample_ris_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the stdlib json fallback writes the same bytes as orjson."""
+    import srdedupe.api as api
+
+    pytest.importorskip("orjson")
+    records = parse_file(sample_ris_file)
+
+    fast_file = tmp_path / "fast.jsonl"
+    assert write_jsonl(records, fast_file) == len(records)
+
+    monkeypatch.setattr(api, "orjson", None)
+    stdlib_file = tmp_path / "stdlib.jsonl"
+    assert write_jsonl(records, stdlib_file) == len(records)
+
+    assert fast_file.read_bytes() == stdlib_file.read_bytes()
+
+
+@pytest.mark.unit
+def test_write_jsonl_non_finite_floats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test NaN is written as null by orjson and rejected by the stdlib fallback."""
+    import srdedupe.api as api
+
+    pytest.importorskip("orjson")
+
+    class _Record:
+        def to_dict(self) -> dict[str, float]:
+            return {"score": float("nan")}
+
+    output_file = tmp_path / "out.jsonl"
+    write_jsonl([_Record()], output_file)  # type: ignore[list-item]
+    assert output_file.read_bytes() == b'{"score":null}\n'
+
+    monkeypatch.setattr(api, "orjson", None)
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        write_jsonl([_Record()], output_file)  # type: ignore[list-item]
+
+
 # ---------------------------------------------------------------------------
 # to_dict / serialization
 # ---------------------------------------------------------------------------
@@ -2,9 +2,11 @@
 
 import json
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
+from srdedupe.audit import context as context_module
 from srdedupe.audit.context import RunContext
 
 
@@ -46,11 +48,11 @@ def test_context_stage_lifecycle(tmp_path: Path) -> None:
     run.finish_stage("s1", counters={"records_in": 50, "records_out": 48})
 
     stage = run.manifest_writer.manifest.stages[0]
-    assert stage.name == "s1"
-    assert stage.finished_at is not None
-    assert stage.duration_seconds is not None
-    assert stage.duration_seconds >= 0
-    assert stage.counters["records_out"] == 48
+    assert stage["name"] == "s1"
+    assert stage["finished_at"] is not None
+    assert stage["duration_seconds"] is not None
+    assert stage["duration_seconds"] >= 0
+    assert stage["counters"]["records_out"] == 48
 
     run.finish(status="success")
 
@@ -77,10 +79,10 @@ def test_context_error_recording(tmp_path: Path) -> None:
     run.record_error(exc, stage="s1", include_traceback=True)
 
     error = run.manifest_writer.manifest.errors[0]
-    assert error.exception_class == "ValueError"
-    assert error.message == "bad input"
-    assert error.stage == "s1"
-    assert error.traceback is not None
+    assert error["exception_class"] == "ValueError"
+    assert error["message"] == "bad input"
+    assert error["stage"] == "s1"
+    assert error["traceback"] is not None
 
     run.finish(status="failed")
 
@@ -148,3 +150,44 @@ def test_context_full_workflow_produces_valid_outputs(tmp_path: Path) -> None:
     # events.jsonl is hashed in outputs
     artifact_paths = [a["path"] for a in data["outputs"]["artifacts"]]
     assert "events.jsonl" in artifact_paths
+
+
+@pytest.mark.unit
+def test_context_durations_use_monotonic_clock(tmp_path: Path) -> None:
+    """Test stage and run durations come from perf_counter_ns deltas."""
+    clock = Mock()
+    clock.perf_counter_ns.side_effect = [
+        100_000_000_000,
+        101_000_000_000,
+        103_500_000_000,
+        110_000_000_000,
+    ]
+
+    with patch.object(context_module, "time", clock):
+        run = RunContext.start(output_dir=tmp_path, parameters={})
+        run.start_stage("s1")
+        run.finish_stage("s1")
+        run.finish(status="success")
+
+    manifest = _read_manifest(tmp_path)
+    assert manifest["stages"][0]["duration_seconds"] == 2.5
+    assert manifest["duration_seconds"] == 10.0
+
+
+@pytest.mark.unit
+def test_context_record_traceback_budget(tmp_path: Path) -> None:
+    """Test record-level tracebacks stop after the budget; stage-level ones do not."""
+    run = RunContext.start(output_dir=tmp_path, parameters={}, max_record_tracebacks=2)
+
+    for i in range(4):
+        try:
+            raise ValueError(f"bad record {i}")
+        except ValueError as exc:
+            run.record_error(exc, stage="s1", rid=f"r{i}", include_traceback=True)
+    run.record_error(RuntimeError("stage failed"), stage="s1", include_traceback=True)
+
+    errors = run.manifest_writer.manifest.errors
+    assert [e["traceback"] is not None for e in errors] == [True, True, False, False, True]
+    assert "bad record 0" in errors[0]["traceback"]
+
+    run.finish(status="failed")
@@ -2,6 +2,7 @@
 
 import subprocess
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -17,6 +18,14 @@ from srdedupe.audit.helpers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_git_sha_cache() -> None:
+    """Reset the memoized git SHA so each test sees its own mocks."""
+    get_git_sha.cache_clear()
+    yield
+    get_git_sha.cache_clear()
+
+
 @pytest.mark.unit
 def test_generate_run_id_format_and_uniqueness() -> None:
     """Test run ID has correct format and successive calls are unique."""
@@ -50,12 +59,28 @@ def test_parse_iso_timestamp(iso_str: str, expected_year: int) -> None:
     assert result.tzinfo is not None
 
 
+_SHA = "abcdef1234567890abcdef1234567890abcdef12"
+# A .git path that is not a directory forces the git rev-parse fallback
+_GITFILE = Path("/nonexistent/.git")
+
+
+def _make_git_dir(root: Path, head: str) -> Path:
+    """Create a minimal .git directory with the given HEAD contents."""
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head, encoding="utf-8")
+    return git_dir
+
+
 @pytest.mark.unit
 def test_get_git_sha_success() -> None:
     """Test git SHA is truncated to 7 chars on success."""
     mock_result = Mock(stdout="abcdef1234567890\n")
 
-    with patch("subprocess.run", return_value=mock_result):
+    with (
+        patch("srdedupe.audit.helpers._find_git_dir", return_value=_GITFILE),
+        patch("subprocess.run", return_value=mock_result),
+    ):
         assert get_git_sha() == "abcdef1"
 
 
@@ -66,10 +91,54 @@ def test_get_git_sha_success() -> None:
 )
 def test_get_git_sha_returns_none_on_failure(side_effect: type | Exception) -> None:
     """Test git SHA returns None for all failure modes."""
-    with patch("subprocess.run", side_effect=side_effect):
+    with (
+        patch("srdedupe.audit.helpers._find_git_dir", return_value=_GITFILE),
+        patch("subprocess.run", side_effect=side_effect),
+    ):
         assert get_git_sha() is None
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("layout", ["loose_ref", "packed_ref", "detached"])
+def test_get_git_sha_reads_git_dir_without_subprocess(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, layout: str
+) -> None:
+    """Test HEAD is resolved from files for branch, packed and detached layouts."""
+    if layout == "detached":
+        _make_git_dir(tmp_path, f"{_SHA}\n")
+    else:
+        git_dir = _make_git_dir(tmp_path, "ref: refs/heads/main\n")
+        if layout == "loose_ref":
+            (git_dir / "refs" / "heads" / "main").write_text(f"{_SHA}\n", encoding="utf-8")
+        else:
+            (git_dir / "packed-refs").write_text(
+                f"# pack-refs with: peeled\n{_SHA} refs/heads/main\n", encoding="utf-8"
+            )
+
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+
+    with patch("subprocess.run") as mock_run:
+        assert get_git_sha() == _SHA[:7]
+
+    mock_run.assert_not_called()
+
+
+@pytest.mark.unit
+def test_get_git_sha_falls_back_for_gitfile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a .git file (worktree/submodule) falls back to git rev-parse."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    with patch("subprocess.run", return_value=Mock(stdout=f"{_SHA}\n")) as mock_run:
+        assert get_git_sha() == _SHA[:7]
+
+    mock_run.assert_called_once()
+
+
 @pytest.mark.unit
 def test_environment_info_functions() -> None:
     """Test version/platform functions return non-empty strings."""
@@ -87,3 +156,43 @@ def test_get_dependency_versions() -> None:
 
     assert "." in versions["pytest"]
     assert versions["nonexistent_xyz_pkg"] == "unknown"
+
+
+@pytest.mark.unit
+def test_get_git_sha_is_cached() -> None:
+    """Test the git lookup runs once per process."""
+    mock_result = Mock(stdout="abcdef1234567890\n")
+
+    with (
+        patch("srdedupe.audit.helpers._find_git_dir", return_value=_GITFILE),
+        patch("subprocess.run", return_value=mock_result) as mock_run,
+    ):
+        assert get_git_sha() == "abcdef1"
+        assert get_git_sha() == "abcdef1"
+
+    assert mock_run.call_count == 1
+
+
+@pytest.mark.unit
+def test_get_dependency_versions_returns_independent_copies() -> None:
+    """Test cached dependency versions are not shared between callers."""
+    first = get_dependency_versions(["pytest"])
+    first["pytest"] = "mutated"
+
+    assert get_dependency_versions(["pytest"])["pytest"] != "mutated"
+
+
+@pytest.mark.unit
+def test_get_git_sha_outside_repository_skips_subprocess(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test no git process is spawned when no .git exists and GIT_DIR is unset."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+
+    with (
+        patch("srdedupe.audit.helpers._find_git_dir", return_value=None),
+        patch("subprocess.run") as mock_run,
+    ):
+        assert get_git_sha() is None
+
+    mock_run.assert_not_called()
@@ -1,11 +1,18 @@
 """Tests for audit logger module."""
 
 import json
+import subprocess
+import sys
+from dataclasses import fields
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from srdedupe.audit import logger as logger_module
 from srdedupe.audit.logger import AuditLogger
+from srdedupe.audit.models import LogEvent
+from srdedupe.utils import calculate_file_sha256
 
 
 @pytest.fixture
@@ -16,6 +23,12 @@ def logger(tmp_path: Path) -> AuditLogger:
     lg.close()
 
 
+def _flushed_events(logger: AuditLogger) -> list[dict]:
+    """Flush the logger and read its events."""
+    logger.flush()
+    return _read_events(logger.log_path)
+
+
 def _read_events(path: Path) -> list[dict]:
     """Read all JSONL events from file."""
     with path.open() as f:
@@ -35,7 +48,7 @@ def test_logger_event_writes_valid_jsonl(logger: AuditLogger) -> None:
     """Test event() writes a valid JSONL line with correct envelope."""
     logger.event("test_event", data={"key": "value"}, level="INFO", rid="r1")
 
-    events = _read_events(logger.log_path)
+    events = _flushed_events(logger)
 
     assert len(events) == 1
     evt = events[0]
@@ -56,11 +69,11 @@ def test_logger_stage_context_inheritance(logger: AuditLogger) -> None:
     logger.set_stage(None)
     logger.event("ev3")
 
-    events = _read_events(logger.log_path)
+    events = _flushed_events(logger)
 
     assert events[0]["stage"] == "stage1"
     assert events[1]["stage"] == "override"
-    assert events[2]["stage"] is None
+    assert "stage" not in events[2]
 
 
 @pytest.mark.unit
@@ -101,7 +114,7 @@ def test_logger_convenience_methods(
     """Test all convenience methods produce correct event type and level."""
     getattr(logger, method)(**kwargs)
 
-    events = _read_events(logger.log_path)
+    events = _flushed_events(logger)
 
     assert len(events) == 1
     assert events[0]["event"] == expected_event
@@ -114,7 +127,7 @@ def test_logger_multiple_events_appended(logger: AuditLogger) -> None:
     for i in range(3):
         logger.event(f"ev_{i}")
 
-    events = _read_events(logger.log_path)
+    events = _flushed_events(logger)
     assert [e["event"] for e in events] == ["ev_0", "ev_1", "ev_2"]
 
 
@@ -150,3 +163,189 @@ def test_logger_creates_parent_directories(tmp_path: Path) -> None:
 
     assert nested.exists()
     assert len(_read_events(nested)) == 1
+
+
+@pytest.mark.unit
+def test_logger_buffers_until_flush(logger: AuditLogger) -> None:
+    """Test events are buffered in memory until flush() is called."""
+    logger.event("buffered")
+    assert logger.log_path.read_bytes() == b""
+
+    logger.flush()
+    assert [e["event"] for e in _read_events(logger.log_path)] == ["buffered"]
+
+
+@pytest.mark.unit
+def test_logger_preserves_order_across_writer_batches(tmp_path: Path) -> None:
+    """Test events larger than one writer batch keep their emission order."""
+    log_path = tmp_path / "events.jsonl"
+    with AuditLogger(run_id="r1", log_path=log_path) as lg:
+        for i in range(1000):
+            lg.event("ev", data={"i": i})
+
+    assert [e["data"]["i"] for e in _read_events(log_path)] == list(range(1000))
+
+
+@pytest.mark.unit
+def test_logger_event_after_close_raises(tmp_path: Path) -> None:
+    """Test emitting an event on a closed logger raises ValueError."""
+    lg = AuditLogger(run_id="r1", log_path=tmp_path / "events.jsonl")
+    lg.close()
+    lg.close()
+
+    with pytest.raises(ValueError, match="closed"):
+        lg.event("late")
+
+
+@pytest.mark.unit
+def test_logger_event_keys_match_log_event_fields(logger: AuditLogger) -> None:
+    """Test a full envelope has exactly the LogEvent fields, in order."""
+    logger.event("ev", stage="s1", rid="r1")
+
+    assert list(_flushed_events(logger)[0]) == [f.name for f in fields(LogEvent)]
+
+
+@pytest.mark.unit
+def test_logger_omits_null_stage_and_rid(logger: AuditLogger) -> None:
+    """Test stage and rid keys are left out when they have no value."""
+    logger.event("ev")
+
+    assert list(_flushed_events(logger)[0]) == ["ts", "run_id", "level", "event", "data"]
+
+
+@pytest.mark.unit
+def test_logger_stdlib_fallback_matches_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the stdlib json fallback writes the same bytes as orjson."""
+    pytest.importorskip("orjson")
+    data = {"title": "Ünïcode — ok", "score": 0.125, "n": 3, "nested": {"k": [1, None]}}
+
+    def _write(path: Path) -> bytes:
+        with AuditLogger(run_id="r1", log_path=path) as lg:
+            lg.event("ev", data=data, rid="r1")
+        return path.read_bytes()
+
+    fast = _write(tmp_path / "fast.jsonl")
+    monkeypatch.setattr(logger_module, "orjson", None)
+    slow = _write(tmp_path / "slow.jsonl")
+
+    # Timestamps differ between runs; compare everything else
+    fast_event, slow_event = json.loads(fast), json.loads(slow)
+    fast_event.pop("ts")
+    slow_event.pop("ts")
+    assert fast_event == slow_event
+    assert fast.split(b',"level"', 1)[1] == slow.split(b',"level"', 1)[1]
+
+
+@pytest.mark.unit
+def test_dumps_float_parity_between_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test both backends agree on float values, though not always on spelling."""
+    pytest.importorskip("orjson")
+    floats = [1e-05, 1e16, 0.1, 1e-07, 123456789.125, 2.5e-300, -0.0]
+
+    fast = logger_module._dumps(floats)
+    monkeypatch.setattr(logger_module, "orjson", None)
+    slow = logger_module._dumps(floats)
+
+    assert fast != slow  # e.g. 0.00001 vs 1e-05
+    assert json.loads(fast) == json.loads(slow) == floats
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_dumps_non_finite_floats(monkeypatch: pytest.MonkeyPatch, value: float) -> None:
+    """Test non-finite floats never produce non-standard JSON tokens."""
+    pytest.importorskip("orjson")
+    assert logger_module._dumps({"x": value}) == b'{"x":null}'
+
+    monkeypatch.setattr(logger_module, "orjson", None)
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        logger_module._dumps({"x": value})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_logger_line_matches_full_envelope_serialization(
+    logger: AuditLogger, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    """Test pre-encoded envelope pieces give the same bytes as dumping the dict."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(logger_module, "orjson", None)
+
+    logger.set_stage('stage "quoted"')
+    logger.event("ev", data={"title": "Ünïcode", "n": 1}, level="WARN", rid="r-1")
+    line = _flushed_events(logger)[0]
+
+    expected = json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n"
+    assert logger.log_path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.unit
+def test_logger_digest_and_size_match_file(tmp_path: Path) -> None:
+    """Test the incremental digest equals hashing the file, including appends."""
+    log_path = tmp_path / "events.jsonl"
+    with AuditLogger(run_id="r1", log_path=log_path) as lg:
+        lg.event("first")
+
+    lg2 = AuditLogger(run_id="r2", log_path=log_path)
+    for i in range(300):
+        lg2.event("ev", data={"i": i})
+    digest, size = lg2.digest_and_size()
+    lg2.close()
+
+    assert digest == calculate_file_sha256(log_path)
+    assert size == log_path.stat().st_size
+    assert lg2.digest_and_size() == (digest, size)
+
+
+class _FailingFile:
+    """File stand-in whose writes raise a non-OSError."""
+
+    def __init__(self, inner: Any) -> None:
+        self.inner = inner
+
+    def write(self, data: bytes) -> int:
+        raise TypeError("cannot write")
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+@pytest.mark.unit
+def test_logger_writer_error_is_raised_not_hung(tmp_path: Path) -> None:
+    """Test any writer-thread error surfaces from flush/close instead of hanging."""
+    lg = AuditLogger(run_id="r1", log_path=tmp_path / "events.jsonl")
+    lg._file = _FailingFile(lg._file)  # type: ignore[assignment]
+
+    lg.event("first")
+    with pytest.raises(TypeError, match="cannot write"):
+        lg.flush()
+
+    lg.event("second")
+    with pytest.raises(TypeError, match="cannot write"):
+        lg.close()
+    assert lg._writer.is_alive() is False
+
+
+@pytest.mark.unit
+def test_logger_unclosed_at_exit_writes_all_events(tmp_path: Path) -> None:
+    """Test events queued by a logger that is never closed still reach the file."""
+    log_path = tmp_path / "events.jsonl"
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from srdedupe.audit.logger import AuditLogger\n"
+        "lg = AuditLogger(run_id='r1', log_path=Path(sys.argv[1]))\n"
+        "for i in range(5000):\n"
+        "    lg.event('ev', {'i': i})\n"
+    )
+    subprocess.run([sys.executable, "-c", script, str(log_path)], check=True)
+
+    events = _read_events(log_path)
+    assert [e["data"]["i"] for e in events] == list(range(5000))
@@ -1,6 +1,8 @@
 """Tests for manifest writer module."""
 
 import json
+import os
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
@@ -12,6 +14,7 @@ from srdedupe.audit.models import (
     ErrorInfo,
     FileInfo,
     InputsInfo,
+    ManifestData,
     StageInfo,
 )
 
@@ -58,9 +61,9 @@ def test_manifest_stage_lifecycle(writer: ManifestWriter) -> None:
     writer.finish_stage("s1", finished_at="2026-02-03T12:05:00Z", duration_seconds=300.0)
 
     result = writer.manifest.stages[0]
-    assert result.counters == {"in": 100, "out": 95, "flagged": 5}
-    assert result.finished_at == "2026-02-03T12:05:00Z"
-    assert result.duration_seconds == 300.0
+    assert result["counters"] == {"in": 100, "out": 95, "flagged": 5}
+    assert result["finished_at"] == "2026-02-03T12:05:00Z"
+    assert result["duration_seconds"] == 300.0
 
 
 @pytest.mark.unit
@@ -83,9 +86,9 @@ def test_manifest_compute_output_artifacts(writer: ManifestWriter, tmp_path: Pat
 
     artifacts = writer.manifest.outputs.artifacts
     assert len(artifacts) == 1
-    assert artifacts[0].path == "events.jsonl"
-    assert artifacts[0].sha256.startswith("sha256:")
-    assert artifacts[0].bytes == events_path.stat().st_size
+    assert artifacts[0]["path"] == "events.jsonl"
+    assert artifacts[0]["sha256"].startswith("sha256:")
+    assert artifacts[0]["bytes"] == events_path.stat().st_size
 
 
 @pytest.mark.unit
@@ -112,6 +115,25 @@ def test_manifest_atomic_write(writer: ManifestWriter, tmp_path: Path) -> None:
     assert data["duration_seconds"] == 600.0
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_manifest_rewrite_replaces_existing(
+    writer: ManifestWriter,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    use_tmpfile: bool,
+) -> None:
+    """Test repeated writes replace run.json via O_TMPFILE or the rename fallback."""
+    if not use_tmpfile:
+        monkeypatch.delattr(os, "O_TMPFILE", raising=False)
+
+    writer.finish(status="partial")
+    writer.finish(status="success")
+
+    assert json.loads(writer.manifest_path.read_text(encoding="utf-8"))["status"] == "success"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["run.json"]
+
+
 @pytest.mark.unit
 def test_manifest_complete_workflow(writer: ManifestWriter, tmp_path: Path) -> None:
     """Test full workflow: inputs → stage → error → finish → valid JSON."""
@@ -164,3 +186,35 @@ def test_manifest_to_dict(writer: ManifestWriter) -> None:
     assert d["run_id"] == "test_run_123"
     # Roundtrip through JSON should not raise
     json.loads(json.dumps(d))
+
+
+@pytest.mark.unit
+def test_manifest_to_dict_keys_follow_model_fields(writer: ManifestWriter) -> None:
+    """Test to_dict emits every ManifestData field in declaration order."""
+    writer.add_stage(StageInfo(name="s1", started_at="2026-02-03T12:00:00Z"))
+
+    d = writer.to_dict()
+
+    assert list(d) == [f.name for f in fields(ManifestData)]
+    assert d["stages"][0]["artifacts"] == []
+
+
+@pytest.mark.unit
+def test_manifest_compute_artifacts_uses_precomputed_digest(writer: ManifestWriter) -> None:
+    """Test a precomputed events digest is registered without reading the file."""
+    writer.compute_output_artifacts(events_digest=("sha256:" + "b" * 64, 42))
+
+    artifacts = writer.manifest.outputs.artifacts
+    assert artifacts == [
+        {"path": "events.jsonl", "sha256": "sha256:" + "b" * 64, "bytes": 42, "record_count": None}
+    ]
+
+
+@pytest.mark.unit
+def test_audit_models_use_slots() -> None:
+    """Test audit dataclasses are slotted (no per-instance __dict__)."""
+    stage = StageInfo(name="s1", started_at="2026-02-03T12:00:00Z")
+
+    assert not hasattr(stage, "__dict__")
+    with pytest.raises(AttributeError):
+        stage.unknown_field = 1  # type: ignore[attr-defined]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 
 from srdedupe.candidates import (
@@ -10,6 +12,7 @@ from srdedupe.candidates import (
     BibYearPM1FirstAuthorBlocker,
     BibYearPM1TitlePrefixBlocker,
     BlockerConfig,
+    BlockerStats,
     DOIExactBlocker,
     MinHashLSHTitleBlocker,
     PMIDExactBlocker,
@@ -17,6 +20,7 @@ from srdedupe.candidates import (
     create_blocker,
     create_blockers,
 )
+from srdedupe.candidates.blockers import _compute_simhash, _deterministic_hash, title_tokens
 from srdedupe.models import SCHEMA_VERSION, Canon, CanonicalRecord, Flags, Keys, Meta, Raw, RawTag
 
 # ============================================================================
@@ -158,6 +162,66 @@ def test_pmid_blocker_yields_pmid_and_nothing_when_absent() -> None:
     assert list(b.block_keys(_record("r3", pmid_norm=""))) == []
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("blocker", [DOIExactBlocker(), PMIDExactBlocker()])
+def test_exact_blocker_key_column_agrees_with_block_keys(
+    blocker: DOIExactBlocker | PMIDExactBlocker,
+) -> None:
+    """The columnar fast path yields exactly what block_keys would."""
+    records = [
+        _record("r1", doi_norm="10.1/x", pmid_norm="1"),
+        _record("r2"),
+        _record("r3", doi_norm="", pmid_norm=""),
+    ]
+    column = blocker.key_column(records)
+    assert [[k] if k else [] for k in column] == [list(blocker.block_keys(r)) for r in records]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "blocker",
+    [
+        MinHashLSHTitleBlocker(),
+        SimHashTitleBlocker(),
+        BibRareTitleTokensBlocker(df_max_ratio=1.0),
+    ],
+    ids=lambda b: b.name,
+)
+def test_title_token_keys_agrees_with_block_keys(
+    blocker: MinHashLSHTitleBlocker | SimHashTitleBlocker | BibRareTitleTokensBlocker,
+) -> None:
+    """The shared-token path yields exactly what block_keys would."""
+    records = [
+        _record("r1", title_norm_basic="deep learning for systematic reviews of trials"),
+        _record("r2", title_norm_basic="deep learning"),
+        _record("r3", title_norm_basic=""),
+    ]
+    if isinstance(blocker, BibRareTitleTokensBlocker):
+        blocker.initialize(records)
+
+    assert title_tokens(records[0]) == [
+        "deep",
+        "learning",
+        "for",
+        "systematic",
+        "reviews",
+        "trials",
+    ]
+    for record in records:
+        assert list(blocker.title_token_keys(record, title_tokens(record))) == list(
+            blocker.block_keys(record)
+        )
+
+
+@pytest.mark.unit
+def test_blocker_stats_to_dict_covers_every_field() -> None:
+    """The hand-written to_dict stays in sync with the dataclass fields."""
+    stats = BlockerStats(*range(1, len(fields(BlockerStats)) + 1))
+    expected = {f.name: getattr(stats, f.name) for f in fields(BlockerStats)}
+    assert stats.to_dict() == expected
+    assert list(stats.to_dict()) == list(expected)
+
+
 # ============================================================================
 # MinHash LSH
 # ============================================================================
@@ -185,6 +249,22 @@ def test_minhash_identical_titles_share_all_bands() -> None:
     assert keys_a == keys_b
 
 
+@pytest.mark.unit
+def test_minhash_signature_matches_scalar_reference() -> None:
+    """Vectorised signature equals per-token, per-permutation arithmetic."""
+    b = MinHashLSHTitleBlocker(num_perm=32, bands=8)
+    tokens = ["machine", "learning", "algorithms", "data", "learning"]
+    prime, mask, wrap = (1 << 61) - 1, (1 << 32) - 1, 1 << 64
+    expected = [
+        min(
+            ((int(a) * (_deterministic_hash(t) & mask) + int(c)) % wrap % prime) & mask
+            for t in tokens
+        )
+        for a, c in zip(b._perm_a, b._perm_b, strict=True)
+    ]
+    assert b._signature(tokens).tolist() == expected
+
+
 @pytest.mark.unit
 def test_minhash_skips_missing_or_short_titles() -> None:
     """MinHash produces nothing for missing or too-short titles."""
@@ -211,6 +291,36 @@ def test_simhash_produces_deterministic_chunked_keys() -> None:
     assert keys == list(b.block_keys(rec))  # deterministic
 
 
+def _reference_simhash(tokens: list[str], bits: int) -> int:
+    """Bit-by-bit SimHash used to check the vectorised implementation."""
+    vector = [0] * bits
+    for token in tokens:
+        h = _deterministic_hash(token)
+        for i in range(bits):
+            vector[i] += 1 if (h >> i) & 1 else -1
+    return sum(1 << i for i in range(bits) if vector[i] > 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("bits", [64, 32, 16])
+def test_simhash_matches_reference_implementation(bits: int) -> None:
+    """Vectorised SimHash equals the per-bit reference on varied inputs."""
+    vocab = ["machine", "learning", "data", "deep", "network", "model", "trial", "review"]
+    for n in range(len(vocab) + 1):
+        tokens = vocab[:n] + vocab[: n // 2]
+        assert _compute_simhash(tokens, bits) == _reference_simhash(tokens, bits)
+
+
+@pytest.mark.unit
+def test_deterministic_hash_is_stable_and_seed_sensitive() -> None:
+    """Token hashes are 64-bit, repeatable, and vary with the seed."""
+    h = _deterministic_hash("learning")
+    assert h == _deterministic_hash("learning", seed=0)
+    assert 0 <= h < 1 << 64
+    assert _deterministic_hash("learning", seed=1) != h
+    assert _deterministic_hash("learning", seed=1) == _deterministic_hash("learning", seed=1)
+
+
 @pytest.mark.unit
 def test_simhash_skips_missing_or_short_titles() -> None:
     """SimHash produces nothing for missing or too-short titles."""
@@ -308,6 +418,10 @@ def test_rare_tokens_selects_rarest() -> None:
     keys = list(b.block_keys(_RARE_CORPUS[0]))
     assert keys == ["rt:algorithms"]
 
+    # Raising the ratio after initialize widens the cut-off: max_df = 2
+    b.df_max_ratio = 0.7
+    assert list(b.block_keys(_RARE_CORPUS[0])) == ["rt:algorithms", "rt:machine"]
+
 
 @pytest.mark.unit
 def test_rare_tokens_shared_rare_connects_records() -> None:
@@ -9,6 +9,7 @@ import pytest
 
 from srdedupe.audit.logger import AuditLogger
 from srdedupe.candidates import DOIExactBlocker, PMIDExactBlocker, generate_candidates
+from srdedupe.candidates.models import CandidatePair, CandidateSource
 from srdedupe.models import SCHEMA_VERSION, Canon, CanonicalRecord, Flags, Keys, Meta, Raw, RawTag
 
 # ============================================================================
@@ -176,6 +177,21 @@ def test_block_combinatorics(tmp_path: Path) -> None:
     assert len(_read_pairs(out)) == expected
 
 
+@pytest.mark.unit
+def test_repeated_rid_counts_once_per_block(tmp_path: Path) -> None:
+    """A rid seen twice in a block does not pair with itself or double-count."""
+    records = [
+        _record("b", doi_norm="10.1/x"),
+        _record("a", doi_norm="10.1/x"),
+        _record("b", doi_norm="10.1/x"),
+    ]
+    out = tmp_path / "c.jsonl"
+    stats = generate_candidates([DOIExactBlocker()], records, out)
+
+    assert [p["pair_id"] for p in _read_pairs(out)] == ["a|b"]
+    assert stats["blockers"]["doi_exact"]["max_block"] == 2
+
+
 @pytest.mark.unit
 def test_pair_ids_are_lexicographic(tmp_path: Path) -> None:
     """rid_a < rid_b in every emitted pair, regardless of input order."""
@@ -191,6 +207,16 @@ def test_pair_ids_are_lexicographic(tmp_path: Path) -> None:
     assert pair["rid_b"] == "zebra"
 
 
+@pytest.mark.unit
+def test_pairs_sorted_by_pair_id_when_rids_share_prefixes(tmp_path: Path) -> None:
+    """Output follows pair_id string order even where it differs from rid order."""
+    records = [_record(rid, doi_norm="10.1/x") for rid in ("z", "a!", "a")]
+    out = tmp_path / "c.jsonl"
+    generate_candidates([DOIExactBlocker()], records, out)
+
+    assert [p["pair_id"] for p in _read_pairs(out)] == ["a!|z", "a|a!", "a|z"]
+
+
 @pytest.mark.unit
 def test_deterministic_output(tmp_path: Path) -> None:
     """Shuffled input produces byte-identical output."""
@@ -205,6 +231,56 @@ def test_deterministic_output(tmp_path: Path) -> None:
     assert out1.read_bytes() == out2.read_bytes()
 
 
+@pytest.mark.unit
+def test_stdlib_fallback_matches_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The stdlib json fallback writes the same bytes as orjson."""
+    import srdedupe.candidates.generator as generator
+
+    pytest.importorskip("orjson")
+    recs = [_record(c, doi_norm="10.1/é", pmid_norm="1") for c in ("c", "a", "b")]
+    blockers = [DOIExactBlocker(), PMIDExactBlocker()]
+
+    fast = tmp_path / "fast.jsonl"
+    generate_candidates(blockers, recs, fast)
+
+    monkeypatch.setattr(generator, "orjson", None)
+    stdlib = tmp_path / "stdlib.jsonl"
+    generate_candidates(blockers, recs, stdlib)
+
+    assert fast.read_bytes() == stdlib.read_bytes()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_lines_match_candidate_pair_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    """Assembled lines equal the compact JSON of the equivalent CandidatePair."""
+    import srdedupe.candidates.generator as generator
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(generator, "orjson", None)
+    rids = ['a"q', "b\\s", "c\tç"]
+    recs = [_record(rid, doi_norm='10.1/"é"', pmid_norm="1") for rid in rids]
+    out = tmp_path / "c.jsonl"
+    generate_candidates([DOIExactBlocker(), PMIDExactBlocker()], recs, out)
+
+    lines = out.read_bytes().splitlines(keepends=True)
+    assert len(lines) == 3
+    for line in lines:
+        data = json.loads(line)
+        pair = CandidatePair(
+            pair_id=f"{data['rid_a']}|{data['rid_b']}",
+            rid_a=data["rid_a"],
+            rid_b=data["rid_b"],
+            sources=[CandidateSource(**src) for src in data["sources"]],
+        )
+        expected = json.dumps(pair.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        assert line == expected.encode("utf-8") + b"\n"
+
+
 @pytest.mark.unit
 def test_jsonl_pair_structure(tmp_path: Path) -> None:
     """Each JSONL line contains the required fields."""
@@ -260,6 +336,7 @@ def test_audit_events_emitted(tmp_path: Path) -> None:
 
     out = tmp_path / "c.jsonl"
     generate_candidates([DOIExactBlocker()], records, out, logger=logger)
+    logger.close()
 
     events = [json.loads(line) for line in log_path.read_text().splitlines()]
     event_types = {e["event"] for e in events}
@@ -269,3 +346,29 @@ def test_audit_events_emitted(tmp_path: Path) -> None:
     artifact = next(e for e in events if e["event"] == "artifact_written")
     assert artifact["data"]["record_count"] == 1
     assert "sha256" in artifact["data"]
+
+
+@pytest.mark.unit
+def test_oversized_block_warnings_are_capped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Oversized-block warnings stop at the cap and end with one summary."""
+    import srdedupe.candidates.generator as generator
+
+    monkeypatch.setattr(generator, "MAX_OVERSIZED_BLOCK_EVENTS", 2)
+    records = [_record(f"{doi}{i}", doi_norm=f"10.1/{doi}") for doi in "abcde" for i in range(3)]
+    log_path = tmp_path / "events.jsonl"
+    logger = AuditLogger(run_id="test", log_path=log_path)
+
+    generate_candidates(
+        [DOIExactBlocker()], records, tmp_path / "c.jsonl", logger=logger, max_block_size=2
+    )
+    logger.close()
+
+    events = [json.loads(line) for line in log_path.read_text().splitlines()]
+    oversized = [e for e in events if e["event"] == "oversized_block"]
+    summary = [e for e in events if e["event"] == "oversized_blocks_suppressed"]
+    assert [e["data"]["block_key"] for e in oversized] == ["10.1/a", "10.1/b"]
+    assert len(summary) == 1
+    assert summary[0]["data"]["oversized_blocks"] == 5
+    assert summary[0]["data"]["suppressed"] == 3
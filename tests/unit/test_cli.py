@@ -1,5 +1,6 @@
 """Tests for CLI module."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -28,6 +29,25 @@ def test_cli_version_flag(runner: CliRunner) -> None:
     assert "srdedupe" in result.output
 
 
+@pytest.mark.unit
+def test_cli_version_resolved_lazily(runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the version is looked up on demand, with a development fallback."""
+    import importlib.metadata
+
+    import srdedupe.cli.main as cli_main
+
+    installed = cli_main.__version__
+    assert runner.invoke(cli, ["--version"]).output == f"srdedupe, version {installed}\n"
+
+    def _not_installed(name: str) -> str:
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, "version", _not_installed)
+    assert runner.invoke(cli, ["--version"]).output == "srdedupe, version 0.1.0\n"
+    with pytest.raises(AttributeError):
+        _ = cli_main.not_a_public_name
+
+
 @pytest.mark.unit
 def test_cli_help(runner: CliRunner) -> None:
     """Test --help output lists commands."""
@@ -93,7 +113,8 @@ def test_parse_folder(runner: CliRunner, tmp_path: Path) -> None:
 
     assert result.exit_code == 0
     assert output_file.exists()
-    assert "Successfully wrote" in result.output
+    written = len(output_file.read_text(encoding="utf-8").splitlines())
+    assert f"Successfully wrote {written} records" in result.output
 
 
 # ---------------------------------------------------------------------------
@@ -141,3 +162,38 @@ def test_deduplicate_verbose_flag(runner: CliRunner, tmp_path: Path) -> None:
 
     assert result.exit_code == 0
     assert "starting deduplication pipeline" in result.output.lower()
+
+
+# ---------------------------------------------------------------------------
+# audit command
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_audit_show_pretty_prints_manifest(runner: CliRunner, tmp_path: Path) -> None:
+    """Test audit show re-indents the compact run.json of a run directory."""
+    from srdedupe.audit import RunContext
+
+    run = RunContext.start(output_dir=tmp_path, parameters={"k": "ü"})
+    run.finish(status="success")
+
+    manifest_text = (tmp_path / "run.json").read_text(encoding="utf-8")
+    assert "\n  " not in manifest_text
+
+    result = runner.invoke(cli, ["audit", "show", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert '\n  "status": "success"' in result.output
+    assert json.loads(result.output) == json.loads(manifest_text)
+
+
+@pytest.mark.unit
+def test_audit_show_invalid_json(runner: CliRunner, tmp_path: Path) -> None:
+    """Test audit show fails cleanly on a malformed manifest."""
+    bad = tmp_path / "run.json"
+    bad.write_text("{not json", encoding="utf-8")
+
+    result = runner.invoke(cli, ["audit", "show", str(bad)])
+
+    assert result.exit_code == 1
+    assert "Error" in result.output
@@ -5,15 +5,17 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
 from srdedupe.clustering import (
     ClusteringConfig,
     ClusterStatus,
+    Edge,
     build_clusters,
 )
+from srdedupe.clustering.cluster_builder import _component_labels
 from srdedupe.clustering.models import compute_cluster_id
-from srdedupe.clustering.union_find import UnionFind
 from srdedupe.models import CanonicalRecord
 
 # ---------------------------------------------------------------------------
@@ -50,39 +52,96 @@ def _write_decisions(tmp_path: Path, decisions: list[dict[str, Any]]) -> Path:
 
 
 # ---------------------------------------------------------------------------
-# Union-Find
+# Component labelling
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.unit
-def test_union_find_basic() -> None:
-    """Test basic Union-Find operations."""
-    uf = UnionFind()
+@pytest.mark.parametrize("seed", range(5))
+def test_component_labels_match_graph_search(seed: int) -> None:
+    """Vectorised component labels partition nodes like a plain graph search."""
+    rng = np.random.default_rng(seed)
+    n_nodes = 200
+    rid_a = rng.integers(0, n_nodes, size=150)
+    rid_b = rng.integers(0, n_nodes, size=150)
+
+    labels = _component_labels(rid_a, rid_b, n_nodes)
+
+    neighbours: list[set[int]] = [set() for _ in range(n_nodes)]
+    for a, b in zip(rid_a.tolist(), rid_b.tolist(), strict=True):
+        neighbours[a].add(b)
+        neighbours[b].add(a)
+    expected = set()
+    seen: set[int] = set()
+    for start in range(n_nodes):
+        if start in seen:
+            continue
+        component, stack = {start}, [start]
+        while stack:
+            for nxt in neighbours[stack.pop()] - component:
+                component.add(nxt)
+                stack.append(nxt)
+        seen |= component
+        expected.add(frozenset(component))
+    got = {frozenset(np.flatnonzero(labels == label).tolist()) for label in set(labels.tolist())}
+    assert got == expected
+    assert all(labels[i] <= i for i in range(n_nodes))
 
-    uf.union("a", "b")
-    uf.union("b", "c")
 
-    assert uf.find("a") == uf.find("b") == uf.find("c")
+# ---------------------------------------------------------------------------
+# Edge
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_edge_from_dict_reason_shapes() -> None:
+    """Test Edge.from_dict accepts dict or string reasons and optional fields."""
+    edge = Edge.from_dict(
+        {
+            "pair_id": "a|b",
+            "rid_a": "a",
+            "rid_b": "b",
+            "decision": "AUTO_DUP",
+            "p_match": 0.5,
+            "reasons": [{"code": "doi_exact", "weight": 1}, {"weight": 2}, "fs_high"],
+        }
+    )
+    assert edge == Edge("a|b", "a", "b", "AUTO_DUP", 0.5, ("doi_exact", "", "fs_high"))
 
-    uf.union("d", "e")
-    assert uf.find("d") == uf.find("e")
-    assert uf.find("d") != uf.find("a")
+    bare = Edge.from_dict({"pair_id": "a|b", "rid_a": "a", "rid_b": "b", "decision": "AUTO_DUP"})
+    assert bare.p_match == 0.0
+    assert bare.reasons == ()
 
 
 @pytest.mark.unit
-def test_union_find_components() -> None:
-    """Test getting connected components."""
-    uf = UnionFind()
+def test_edge_from_dict_shares_reason_tuples() -> None:
+    """Test edges decoded with one intern table share a canonical reasons tuple."""
+    line = json.dumps(_decision("a", "b", reason="p_above_t_high"))
+    reason_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+    first, second = (Edge.from_dict(json.loads(line), reason_tuples) for _ in range(2))
 
-    uf.union("a", "b")
-    uf.union("b", "c")
-    uf.union("d", "e")
+    assert first.reasons == ("p_above_t_high",)
+    assert first.reasons is second.reasons
+    assert reason_tuples == {("p_above_t_high",): first.reasons}
+    assert Edge.from_dict(json.loads(line)).reasons is not first.reasons
 
-    component_sets = [set(comp) for comp in uf.get_components()]
 
-    assert len(component_sets) == 2
-    assert {"a", "b", "c"} in component_sets
-    assert {"d", "e"} in component_sets
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("p_match", "reasons", "use_reason_codes", "expected"),
+    [
+        pytest.param(0.5, ("fs_high", "pmid_exact"), True, True, id="strong_reason"),
+        pytest.param(0.5, ("fs_high", "pmid_exact"), False, False, id="reasons_ignored"),
+        pytest.param(0.5, ("fs_high",), True, False, id="weak_reason_low_score"),
+        pytest.param(0.99, (), True, True, id="high_score"),
+    ],
+)
+def test_edge_is_strong(
+    p_match: float, reasons: tuple[str, ...], use_reason_codes: bool, expected: bool
+) -> None:
+    """Test an edge is strong via a strong reason code or a high p_match."""
+    edge = Edge("a|b", "a", "b", "AUTO_DUP", p_match, reasons)
+    assert edge.is_strong(0.95, use_reason_codes) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -152,6 +211,32 @@ def test_empty_input_no_auto_dup(
     assert len(clusters) == 0
 
 
+@pytest.mark.unit
+def test_stdlib_fallback_loads_same_clusters(
+    tmp_path: Path,
+    make_record: Callable[..., CanonicalRecord],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Decisions decoded by the stdlib json fallback build the same clusters."""
+    import srdedupe.clustering.cluster_builder as cluster_builder
+
+    pytest.importorskip("orjson")
+    path = _write_decisions(
+        tmp_path,
+        [
+            _decision("rid_a", "rid_b"),
+            _decision("rid_b", "rid_c", decision="AUTO_KEEP", p_match=0.1),
+        ],
+    )
+    records = [make_record(rid) for rid in ("rid_a", "rid_b", "rid_c")]
+
+    fast = build_clusters(path, records, ClusteringConfig())
+    monkeypatch.setattr(cluster_builder, "orjson", None)
+    stdlib = build_clusters(path, records, ClusteringConfig())
+
+    assert [c.to_dict() for c in fast] == [c.to_dict() for c in stdlib]
+
+
 @pytest.mark.unit
 def test_determinism_shuffle_input(
     tmp_path: Path,
@@ -314,6 +399,40 @@ def test_transitive_closure_weak_bridge(
     assert "bridged_by_weak_edges" in clusters[0].consistency.soft_conflicts
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("leaf_reason", "leaf_p_match", "bridged"),
+    [
+        ("title_similar", 0.70, True),
+        ("title_similar", 0.9995, False),
+        ("pmid_exact", 0.70, False),
+    ],
+)
+def test_weak_bridge_degree_one_leaf(
+    tmp_path: Path,
+    make_record: Callable[..., CanonicalRecord],
+    leaf_reason: str,
+    leaf_p_match: float,
+    bridged: bool,
+) -> None:
+    """Test a leaf hanging off a strong core is flagged only via a weak edge."""
+    path = _write_decisions(
+        tmp_path,
+        [
+            _decision("rid_a", "rid_b", reason="doi_exact"),
+            _decision("rid_a", "rid_c", reason="doi_exact"),
+            _decision("rid_b", "rid_c", reason="doi_exact"),
+            _decision("rid_c", "rid_d", p_match=leaf_p_match, reason=leaf_reason),
+        ],
+    )
+    records = [make_record(rid) for rid in ("rid_a", "rid_b", "rid_c", "rid_d")]
+
+    clusters = build_clusters(path, records, ClusteringConfig(strong_edge_t_strong=0.999))
+
+    assert len(clusters) == 1
+    assert ("bridged_by_weak_edges" in clusters[0].consistency.soft_conflicts) is bridged
+
+
 @pytest.mark.unit
 def test_year_spread_soft_conflict(
     tmp_path: Path,
@@ -406,3 +525,67 @@ def test_doi_conflict_with_split(
     cluster_rids = [set(c.rids) for c in clusters]
     assert {"rid_a", "rid_c"} in cluster_rids
     assert {"rid_b", "rid_d"} in cluster_rids
+
+
+@pytest.mark.unit
+def test_split_routes_edges_to_subclusters(
+    tmp_path: Path,
+    make_record: Callable[..., CanonicalRecord],
+) -> None:
+    """Test split subclusters keep only their internal edges, in input order."""
+    path = _write_decisions(
+        tmp_path,
+        [
+            _decision("rid_c", "rid_e", reason="doi_exact"),
+            _decision("rid_a", "rid_b", reason="title_exact"),
+            _decision("rid_a", "rid_c", reason="doi_exact"),
+            _decision("rid_b", "rid_d", reason="doi_exact"),
+            _decision("rid_d", "rid_f", reason="title_exact"),
+            _decision("rid_a", "rid_e", reason="pmid_exact"),
+        ],
+    )
+    records = [
+        make_record("rid_a", doi_norm="10.1234/abc"),
+        make_record("rid_b", doi_norm="10.5678/xyz"),
+        make_record("rid_c", doi_norm="10.1234/abc"),
+        make_record("rid_d", doi_norm="10.5678/xyz"),
+        make_record("rid_e", doi_norm="10.1234/abc"),
+        make_record("rid_f"),
+    ]
+
+    clusters = build_clusters(path, records, ClusteringConfig())
+
+    support = {c.rids: c.support for c in clusters}
+    assert set(support) == {("rid_a", "rid_c", "rid_e"), ("rid_b", "rid_d"), ("rid_f",)}
+    assert support["rid_a", "rid_c", "rid_e"].edges_auto_dup == 3
+    assert list(support["rid_a", "rid_c", "rid_e"].sources) == ["doi_exact", "pmid_exact"]
+    assert support["rid_b", "rid_d"].sources == {"doi_exact": 1}
+    assert support["rid_f",].edges_auto_dup == 0
+
+
+@pytest.mark.unit
+def test_doi_split_subcluster_keeps_pmid_conflict(
+    tmp_path: Path,
+    make_record: Callable[..., CanonicalRecord],
+) -> None:
+    """Test subclusters of a DOI split are still checked for PMID conflicts."""
+    path = _write_decisions(
+        tmp_path,
+        [
+            _decision("rid_a", "rid_b", reason="title_exact"),
+            _decision("rid_a", "rid_c", reason="doi_exact"),
+        ],
+    )
+    records = [
+        make_record("rid_a", doi_norm="10.1234/abc", pmid_norm="111"),
+        make_record("rid_b", doi_norm="10.5678/xyz"),
+        make_record("rid_c", doi_norm="10.1234/abc", pmid_norm="222"),
+    ]
+
+    clusters = build_clusters(path, records, ClusteringConfig())
+
+    by_rids = {c.rids: c for c in clusters}
+    assert set(by_rids) == {("rid_a", "rid_c"), ("rid_b",)}
+    hard = by_rids["rid_a", "rid_c"].consistency.hard_conflicts
+    assert "pmid_conflict" in hard
+    assert "doi_conflict" not in hard
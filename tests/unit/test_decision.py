@@ -1,6 +1,7 @@
 """Unit tests for the decision module."""
 
 import json
+import math
 import random
 from collections.abc import Callable
 from pathlib import Path
@@ -323,6 +324,37 @@ def test_conformal_invalid_params_raise(alpha: float, delta: float, match: str)
         calibrate_conformal_threshold(pairs, alpha, delta)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_conformal_matches_per_threshold_scan_with_ties(seed: int) -> None:
+    """Cumulative-count sweep agrees with a direct scan over tied scores."""
+    rng = random.Random(seed)
+    pairs: list[CalibrationPair] = []
+    for i in range(300):
+        score = rng.randint(0, 40) / 40
+        pairs.append(CalibrationPair(f"p{i}", score, rng.random() < score**0.5))
+    alpha, delta = 0.2, 0.1
+    result = calibrate_conformal_threshold(pairs, alpha, delta)
+
+    n = len(pairs)
+    eps = math.sqrt((1 / (2 * n)) * math.log(2 / delta))
+    thresholds = sorted({p.score for p in pairs})
+    expected = float("inf")
+    for t in reversed(thresholds):
+        accepted = [p for p in pairs if p.score >= t]
+        fp = sum(1 for p in accepted if not p.is_duplicate)
+        budget = (n + 1) * alpha * max(len(accepted) / n - eps, 0.0)
+        if budget >= 1.0 and fp <= math.ceil(budget) - 1:
+            expected = t
+
+    assert result.n_thresholds_checked == len(thresholds)
+    assert result.t_high_conformal == expected
+    assert result.feasible
+    accepted = [p for p in pairs if p.score >= expected]
+    assert result.confusion_matrix.fp == sum(1 for p in accepted if not p.is_duplicate)
+    assert result.xi_hat == len(accepted) / n
+
+
 @pytest.mark.unit
 def test_conformal_empty_set_raises() -> None:
     """Empty calibration set raises ValueError."""
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from srdedupe.parse.ingestion import ingest_file, ingest_folder
+from srdedupe.parse.ingestion import find_supported_files, ingest_file, ingest_folder
 
 
 @pytest.fixture
@@ -146,3 +146,58 @@ def test_ingest_file_utf8_bom(tmp_path: Path) -> None:
     assert result.format_detected == "ris"
     assert result.records_parsed == 1
     assert len(result.errors) == 0
+
+
+@pytest.mark.integration
+def test_ingest_folder_parallel_matches_serial(fixtures_dir: Path) -> None:
+    """Test parallel ingestion returns the same records, in the same order."""
+    serial_records, serial_report = ingest_folder(fixtures_dir)
+    parallel_records, parallel_report = ingest_folder(fixtures_dir, workers=2)
+
+    assert [r.rid for r in parallel_records] == [r.rid for r in serial_records]
+    assert [r.filename for r in parallel_report.file_results] == [
+        r.filename for r in serial_report.file_results
+    ]
+    assert parallel_report.total_records == serial_report.total_records
+
+
+@pytest.mark.unit
+def test_find_supported_files_patterns(tmp_path: Path) -> None:
+    """Test file discovery honours pattern, recursion and supported extensions."""
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    for name in ("a.ris", "b.bib", "notes.pdf", "sub/c.ris", "sub/deeper/d.enw"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "folder.ris").mkdir()
+
+    def names(files: list[Path]) -> list[str]:
+        return [f.relative_to(tmp_path).as_posix() for f in files]
+
+    assert sorted(names(find_supported_files(tmp_path))) == ["a.ris", "b.bib"]
+    assert names(find_supported_files(tmp_path, glob_pattern="*.ris")) == ["a.ris"]
+    assert sorted(names(find_supported_files(tmp_path, recursive=True))) == [
+        "a.ris",
+        "b.bib",
+        "sub/c.ris",
+        "sub/deeper/d.enw",
+    ]
+    assert sorted(names(find_supported_files(tmp_path, recursive=True, glob_pattern="*.ris"))) == [
+        "a.ris",
+        "sub/c.ris",
+    ]
+    assert names(find_supported_files(tmp_path, glob_pattern="sub/*.ris")) == ["sub/c.ris"]
+
+
+@pytest.mark.unit
+def test_find_supported_files_does_not_follow_directory_symlinks(tmp_path: Path) -> None:
+    """Test recursive discovery skips symlinked directories, including loops."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.ris").write_text("")
+    try:
+        (tmp_path / "alias").symlink_to(tmp_path / "sub", target_is_directory=True)
+        (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except OSError:  # pragma: no cover
+        pytest.skip("symlinks are not supported here")
+
+    files = find_supported_files(tmp_path, recursive=True)
+
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == ["sub/c.ris"]